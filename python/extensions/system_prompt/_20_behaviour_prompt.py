@@ -15,10 +15,10 @@ def get_custom_rules_file(agent: Agent):
 
 def read_rules(agent: Agent):
     rules_file = get_custom_rules_file(agent)
-    if files.exists(rules_file):
+    # read directly instead of exists() + read, missing file means default rules
+    try:
         rules = files.read_file(rules_file) # no includes and vars here, that could crash
-        return agent.read_prompt("agent.system.behaviour.md", rules=rules)
-    else:
+    except FileNotFoundError:
         rules = agent.read_prompt("agent.system.behaviour_default.md")
-        return agent.read_prompt("agent.system.behaviour.md", rules=rules)
+    return agent.read_prompt("agent.system.behaviour.md", rules=rules)
   
\ No newline at end of file
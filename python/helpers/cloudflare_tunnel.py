@@ -15,6 +15,8 @@ class CloudflareTunnel:
         self.tunnel_process = None
         self.tunnel_url = None
         self._stop_event = threading.Event()
+        # set once the URL is known or the output ended without one
+        self.url_ready = threading.Event()
 
     def download_cloudflared(self):
         """Downloads the appropriate cloudflared binary for the current system"""
@@ -103,22 +105,25 @@ class CloudflareTunnel:
 
     def _extract_tunnel_url(self, process):
         """Extracts the tunnel URL from cloudflared output"""
-        while not self._stop_event.is_set():
-            line = process.stdout.readline()
-            if not line:
-                break
-
-            if isinstance(line, bytes):
-                line = line.decode("utf-8")
-
-            if "trycloudflare.com" in line and "https://" in line:
-                start = line.find("https://")
-                end = line.find("trycloudflare.com") + len("trycloudflare.com")
-                self.tunnel_url = line[start:end].strip()
-                PrintStyle().print("\n=== Cloudflare Tunnel URL ===")
-                PrintStyle().print(f"URL: {self.tunnel_url}")
-                PrintStyle().print("============================\n")
-                return
+        try:
+            while not self._stop_event.is_set():
+                line = process.stdout.readline()
+                if not line:
+                    break
+
+                if isinstance(line, bytes):
+                    line = line.decode("utf-8")
+
+                if "trycloudflare.com" in line and "https://" in line:
+                    start = line.find("https://")
+                    end = line.find("trycloudflare.com") + len("trycloudflare.com")
+                    self.tunnel_url = line[start:end].strip()
+                    PrintStyle().print("\n=== Cloudflare Tunnel URL ===")
+                    PrintStyle().print(f"URL: {self.tunnel_url}")
+                    PrintStyle().print("============================\n")
+                    return
+        finally:
+            self.url_ready.set()
 
     def start(self):
         """Starts the cloudflare tunnel"""
@@ -23,8 +23,8 @@ from langchain_core.documents import Document
 from langchain.schema import SystemMessage, HumanMessage
 
 from python.helpers.print_style import PrintStyle
-from python.helpers import files, errors
-from agent import Agent
+from python.helpers import dotenv, files, errors
+from agent import Agent, InterventionException, HandledException
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
@@ -310,6 +310,48 @@ class DocumentQueryStore:
             PrintStyle.error(f"Error searching documents: {str(e)}")
             return []
 
+    async def search_documents_batch(
+        self,
+        queries: Sequence[str],
+        limit: int = 10,
+        threshold: float = 0.5,
+        filter: str = "",
+    ) -> List[List[Document]]:
+        """
+        Search for documents similar to each of several queries at once.
+
+        Args:
+            queries: The search query strings
+            limit: Maximum number of results to return per query
+            threshold: Minimum similarity score threshold (0-1)
+
+        Returns:
+            One list of matching documents per query
+        """
+
+        # DB not initialized or nothing to search for
+        if not self.vector_db or not any(queries):
+            return [[] for _ in queries]
+
+        # Perform search
+        try:
+            results = await self.vector_db.search_batch_by_similarity_threshold(
+                queries=[query for query in queries if query],
+                limit=limit,
+                threshold=threshold,
+                filter=filter,
+            )
+            found = iter(results)
+            results = [next(found) if query else [] for query in queries]
+
+            PrintStyle.standard(
+                f"Search of {len(queries)} queries returned {sum(len(r) for r in results)} results"
+            )
+            return results
+        except Exception as e:
+            PrintStyle.error(f"Error searching documents: {str(e)}")
+            return [[] for _ in queries]
+
     async def search_document(
         self, document_uri: str, query: str, limit: int = 10, threshold: float = 0.5
     ) -> List[Document]:
@@ -373,40 +415,53 @@ class DocumentQueryHelper:
             *[self.document_get_content(uri, True) for uri in document_uris]
         )
         await self.agent.handle_intervention()
-        selected_chunks = {}
-        for question in questions:
-            self.progress_callback(f"Optimizing query: {question}")
-            await self.agent.handle_intervention()
-            human_content = f'Search Query: "{question}"'
-            system_content = self.agent.parse_prompt(
-                "fw.document_query.optmimize_query.md"
-            )
-
-            optimized_query = (
-                await self.agent.call_utility_model(
-                    system=system_content, message=human_content
-                )
-            ).strip()
-
-            await self.agent.handle_intervention()
-            self.progress_callback(f"Searching documents with query: {optimized_query}")
+        normalized_uris = [self.store.normalize_uri(uri) for uri in document_uris]
+        doc_filter = " or ".join(
+            [f"document_uri == '{uri}'" for uri in normalized_uris]
+        )
 
-            normalized_uris = [self.store.normalize_uri(uri) for uri in document_uris]
-            doc_filter = " or ".join(
-                [f"document_uri == '{uri}'" for uri in normalized_uris]
-            )
+        # questions are optimized concurrently, bounded for rate limits
+        semaphore = asyncio.Semaphore(
+            int(dotenv.get_dotenv_value("DOCQUERY_CONCURRENCY", 4) or 4)
+        )
 
-            chunks = await self.store.search_documents(
-                query=optimized_query,
-                limit=100,
-                threshold=DEFAULT_SEARCH_THRESHOLD,
-                filter=doc_filter,
-            )
+        async def optimize_question(question: str) -> str:
+            async with semaphore:
+                return await self._optimize_query(question)
 
-            self.progress_callback(f"Found {len(chunks)} chunks")
+        results = await asyncio.gather(
+            *[optimize_question(question) for question in questions],
+            return_exceptions=True,
+        )
+        failed = [r for r in results if isinstance(r, BaseException)]
+        for error in failed:
+            # interventions and cancellation still stop the whole Q&A
+            if not isinstance(error, Exception) or isinstance(
+                error, (InterventionException, HandledException)
+            ):
+                raise error
+            self.progress_callback(f"Query optimization failed: {error}")
+        if failed and len(failed) == len(results):
+            raise failed[0]
+
+        # then all optimized queries share one embedding call and search
+        optimized_queries = [r for r in results if isinstance(r, str)]
+        await self.agent.handle_intervention()
+        self.progress_callback(
+            f"Searching documents with queries: {json.dumps(optimized_queries)}"
+        )
+        found = await self.store.search_documents_batch(
+            queries=optimized_queries,
+            limit=100,
+            threshold=DEFAULT_SEARCH_THRESHOLD,
+            filter=doc_filter,
+        )
 
+        selected_chunks = {}
+        for chunks in found:
             for chunk in chunks:
                 selected_chunks[chunk.metadata["id"]] = chunk
+        self.progress_callback(f"Found {len(selected_chunks)} chunks")
 
         if not selected_chunks:
             self.progress_callback("No relevant content found in the documents")
@@ -439,6 +494,20 @@ class DocumentQueryHelper:
 
         return True, str(ai_response)
 
+    async def _optimize_query(self, question: str) -> str:
+        self.progress_callback(f"Optimizing query: {question}")
+        await self.agent.handle_intervention()
+        human_content = f'Search Query: "{question}"'
+        system_content = self.agent.parse_prompt(
+            "fw.document_query.optmimize_query.md"
+        )
+
+        return (
+            await self.agent.call_utility_model(
+                system=system_content, message=human_content
+            )
+        ).strip()
+
     async def document_get_content(
         self, document_uri: str, add_to_db: bool = False
     ) -> str:
@@ -22,21 +22,32 @@ def get_dotenv_value(key: str, default: Any = None):
     return os.getenv(key, default)
 
 def save_dotenv_value(key: str, value: str):
-    if value is None:
-        value = ""
+    save_dotenv_values({key: value})
+
+def save_dotenv_values(values: dict[str, str]):
+    if not values:
+        return
     dotenv_path = get_dotenv_file_path()
     if not os.path.isfile(dotenv_path):
         with open(dotenv_path, "w") as f:
             f.write("")
     with open(dotenv_path, "r+") as f:
         lines = f.readlines()
-        found = False
-        for i, line in enumerate(lines):
-            if re.match(rf"^\s*{key}\s*=", line):
-                lines[i] = f"{key}={value}\n"
-                found = True
-        if not found:
-            lines.append(f"\n{key}={value}\n")
+        original = list(lines)
+        for key, value in values.items():
+            if value is None:
+                value = ""
+            found = False
+            for i, line in enumerate(lines):
+                if re.match(rf"^\s*{key}\s*=", line):
+                    lines[i] = f"{key}={value}\n"
+                    found = True
+            if not found:
+                lines.append(f"\n{key}={value}\n")
+        if lines == original:
+            # file already up to date, skip the rewrite and reload
+            os.environ.update({k: "" if v is None else v for k, v in values.items()})
+            return
         f.seek(0)
         f.writelines(lines)
         f.truncate()
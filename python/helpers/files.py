@@ -90,9 +90,7 @@ def parse_file(
     absolute_path = find_file_in_dirs(_filename, _directories)
 
     # Read the file content
-    with open(absolute_path, "r", encoding=_encoding) as f:
-        # content = remove_code_fences(f.read())
-        content = f.read()
+    content = read_template_file(absolute_path, _encoding)
 
     is_json = is_full_json_template(content)
     content = remove_code_fences(content)
@@ -131,9 +129,7 @@ def read_prompt_file(
     absolute_path = find_file_in_dirs(_file, _directories)
 
     # Read the file content
-    with open(absolute_path, "r", encoding=_encoding) as f:
-        # content = remove_code_fences(f.read())
-        content = f.read()
+    content = read_template_file(absolute_path, _encoding)
 
     variables = load_plugin_variables(_file, _directories, **kwargs) or {}  # type: ignore
     variables.update(kwargs)
@@ -152,6 +148,23 @@ def read_prompt_file(
     return content
 
 
+# prompt template contents by path, reused until the file changes on disk
+_template_cache: dict[tuple[str, str], tuple[int, int, str]] = {}
+
+
+def read_template_file(absolute_path: str, encoding="utf-8") -> str:
+    # prompts are read on every agent step and tool call, only re-read them when edited
+    stat = os.stat(absolute_path)
+    key = (absolute_path, encoding)
+    cached = _template_cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    with open(absolute_path, "r", encoding=encoding) as f:
+        content = f.read()
+    _template_cache[key] = (stat.st_mtime_ns, stat.st_size, content)
+    return content
+
+
 def read_file(relative_path: str, encoding="utf-8"):
     # Try to get the absolute path for the file from the original directory or backup directories
     absolute_path = get_abs_path(relative_path)
@@ -1,6 +1,8 @@
 from PIL import Image
+import binascii
 import io
 import math
+import struct
 
 
 def compress_image(image_data: bytes, *, max_pixels: int = 256_000, quality: int = 50) -> bytes:
@@ -23,6 +25,9 @@ def compress_image(image_data: bytes, *, max_pixels: int = 256_000, quality: int
         scale = math.sqrt(max_pixels / current_pixels)
         new_width = int(img.width * scale)
         new_height = int(img.height * scale)
+        # jpeg sources are decoded at a reduced DCT scale that still covers the target size
+        if img.format == "JPEG":
+            img.draft(img.mode, (new_width, new_height))
         img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
     
     # convert to RGB if needed (for JPEG)
@@ -33,3 +38,49 @@ def compress_image(image_data: bytes, *, max_pixels: int = 256_000, quality: int
     output = io.BytesIO()
     img.save(output, format='JPEG', quality=quality, optimize=True)
     return output.getvalue()
+
+
+def b64_str(image_data: bytes | memoryview) -> str:
+    """Base64 encode any bytes-like buffer (bytes, memoryview, numpy array) straight to str."""
+    return binascii.b2a_base64(image_data, newline=False).decode("ascii")
+
+
+# start-of-frame markers carrying the jpeg dimensions, DHT/JPG/DAC share the range but are not frames
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# png color type -> channels: gray, rgb, palette, gray + alpha, rgba
+_PNG_COMPONENTS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+
+def peek_dims(image_data: bytes) -> tuple[int, int, int] | None:
+    """Read (width, height, components) from a JPEG or PNG header without decoding the image.
+    
+    Components is the channel count, 4 for CMYK/YCCK JPEGs and RGBA PNGs.
+    Returns None for other formats or malformed headers.
+    """
+    if image_data[:8] == b"\x89PNG\r\n\x1a\n" and image_data[12:16] == b"IHDR":
+        width, height, color_type = struct.unpack(">II xB", image_data[16:26])
+        return width, height, _PNG_COMPONENTS.get(color_type, 0)
+
+    if image_data[:2] != b"\xff\xd8":
+        return None
+    i = 2
+    while i + 9 <= len(image_data):
+        if image_data[i] != 0xFF:
+            return None
+        marker = image_data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            if i + 10 > len(image_data):
+                return None
+            height, width, components = struct.unpack(">HHB", image_data[i + 5 : i + 10])
+            return width, height, components
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # markers without a length
+            i += 2
+            continue
+        (length,) = struct.unpack(">H", image_data[i + 2 : i + 4])
+        i += 2 + length
+    return None
+
@@ -1,9 +1,27 @@
+import re
+import time
+from functools import lru_cache
 from datetime import datetime, timezone as dt_timezone, timedelta
+from typing import Any, ClassVar
 import pytz  # type: ignore
 
 from python.helpers.print_style import PrintStyle
-from python.helpers.dotenv import get_dotenv_value, save_dotenv_value
+from python.helpers.dotenv import get_dotenv_value, save_dotenv_values
 
+try:
+    # optional C parser, much faster than datetime.fromisoformat for ISO 8601 input
+    from ciso8601 import parse_datetime as _parse_iso_datetime  # type: ignore
+except ImportError:
+    _parse_iso_datetime = None
+
+# trailing "Z" / "+HH:MM" / "-HHMM" timezone suffix
+_TZ_SUFFIX_RE = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
+
+
+@lru_cache(maxsize=None)
+def _offset_tz(minutes: int) -> dt_timezone:
+    """Shared fixed-offset tzinfo per UTC offset in minutes (bounded by the valid offset range)."""
+    return dt_timezone(timedelta(minutes=minutes))
 
 
 class Localization:
@@ -13,8 +31,13 @@ class Localization:
     to avoid noisy updates when equivalent timezones share the same offset.
     """
 
+    __slots__ = ("timezone", "_offset_minutes", "_local_tz", "_last_timezone_change", "_next_offset_check")
+
     # singleton
-    _instance = None
+    _instance: ClassVar["Localization | None"] = None
+
+    # how long a same-name set_timezone call may skip re-checking the offset (DST changes)
+    OFFSET_RECHECK_SECONDS: ClassVar[int] = 3600
 
     @classmethod
     def get(cls, *args, **kwargs):
@@ -25,7 +48,9 @@ class Localization:
     def __init__(self, timezone: str | None = None):
         self.timezone: str = "UTC"
         self._offset_minutes: int = 0
+        self._local_tz: dt_timezone = dt_timezone.utc
         self._last_timezone_change: datetime | None = None
+        self._next_offset_check: float = 0.0
         # Load persisted values if available
         persisted_tz = str(get_dotenv_value("DEFAULT_USER_TIMEZONE", "UTC"))
         persisted_offset = get_dotenv_value("DEFAULT_USER_UTC_OFFSET_MINUTES", None)
@@ -35,22 +60,27 @@ class Localization:
         else:
             # Initialize from persisted values
             self.timezone = persisted_tz
+            pending: dict[str, str] = {}
             if persisted_offset is not None:
                 try:
                     self._offset_minutes = int(str(persisted_offset))
                 except Exception:
                     self._offset_minutes = self._compute_offset_minutes(self.timezone)
-                    save_dotenv_value("DEFAULT_USER_UTC_OFFSET_MINUTES", str(self._offset_minutes))
+                    pending["DEFAULT_USER_UTC_OFFSET_MINUTES"] = str(self._offset_minutes)
             else:
                 # Compute from timezone and persist
                 self._offset_minutes = self._compute_offset_minutes(self.timezone)
-                save_dotenv_value("DEFAULT_USER_UTC_OFFSET_MINUTES", str(self._offset_minutes))
+                pending["DEFAULT_USER_UTC_OFFSET_MINUTES"] = str(self._offset_minutes)
+            self._local_tz = _offset_tz(self._offset_minutes)
+            # Flush all pending writes in a single .env rewrite
+            save_dotenv_values(pending)
 
     def get_timezone(self) -> str:
         return self.timezone
 
-    def _compute_offset_minutes(self, timezone_name: str) -> int:
-        tzinfo = pytz.timezone(timezone_name)
+    def _compute_offset_minutes(self, timezone_name: str, tzinfo: Any = None) -> int:
+        if tzinfo is None:
+            tzinfo = pytz.timezone(timezone_name)
         now_in_tz = datetime.now(tzinfo)
         offset = now_in_tz.utcoffset()
         return int(offset.total_seconds() // 60) if offset else 0
@@ -68,26 +98,31 @@ class Localization:
 
     def set_timezone(self, timezone: str) -> None:
         """Set the timezone name, but internally store and compare by UTC offset minutes."""
+        # Same timezone as current and offset checked recently: nothing to do (hot path from polling)
+        if timezone == self.timezone and time.monotonic() < self._next_offset_check:
+            return
         try:
             # Validate timezone and compute its current offset
-            _ = pytz.timezone(timezone)
-            new_offset = self._compute_offset_minutes(timezone)
+            tzinfo = pytz.timezone(timezone)
+            new_offset = self._compute_offset_minutes(timezone, tzinfo=tzinfo)
+            self._next_offset_check = time.monotonic() + self.OFFSET_RECHECK_SECONDS
 
             # If offset changes, check rate limit and update
-            if new_offset != getattr(self, "_offset_minutes", None):
+            if new_offset != self._offset_minutes:
                 if not self._can_change_timezone():
                     return
 
-                prev_tz = getattr(self, "timezone", "None")
-                prev_off = getattr(self, "_offset_minutes", None)
                 PrintStyle.debug(
-                    f"Changing timezone from {prev_tz} (offset {prev_off}) to {timezone} (offset {new_offset})"
+                    f"Changing timezone from {self.timezone} (offset {self._offset_minutes}) to {timezone} (offset {new_offset})"
                 )
                 self._offset_minutes = new_offset
+                self._local_tz = _offset_tz(new_offset)
                 self.timezone = timezone
                 # Persist both the human-readable tz and the numeric offset
-                save_dotenv_value("DEFAULT_USER_TIMEZONE", timezone)
-                save_dotenv_value("DEFAULT_USER_UTC_OFFSET_MINUTES", str(self._offset_minutes))
+                save_dotenv_values({
+                    "DEFAULT_USER_TIMEZONE": timezone,
+                    "DEFAULT_USER_UTC_OFFSET_MINUTES": str(self._offset_minutes),
+                })
 
                 # Update rate limit timestamp only when actual change occurs
                 self._last_timezone_change = datetime.now()
@@ -98,9 +133,12 @@ class Localization:
             PrintStyle.error(f"Unknown timezone: {timezone}, defaulting to UTC")
             self.timezone = "UTC"
             self._offset_minutes = 0
+            self._local_tz = dt_timezone.utc
             # save defaults to avoid future errors on startup
-            save_dotenv_value("DEFAULT_USER_TIMEZONE", "UTC")
-            save_dotenv_value("DEFAULT_USER_UTC_OFFSET_MINUTES", "0")
+            save_dotenv_values({
+                "DEFAULT_USER_TIMEZONE": "UTC",
+                "DEFAULT_USER_UTC_OFFSET_MINUTES": "0",
+            })
 
     def localtime_str_to_utc_dt(self, localtime_str: str | None) -> datetime | None:
         """
@@ -112,22 +150,10 @@ class Localization:
             return None
 
         try:
-            # Handle both with and without timezone info
-            try:
-                # Try parsing with timezone info first
-                local_datetime_obj = datetime.fromisoformat(localtime_str)
-                if local_datetime_obj.tzinfo is None:
-                    # If no timezone info, assume fixed offset
-                    local_datetime_obj = local_datetime_obj.replace(
-                        tzinfo=dt_timezone(timedelta(minutes=self._offset_minutes))
-                    )
-            except ValueError:
-                # If timezone parsing fails, try without timezone
-                base = localtime_str.split('Z')[0].split('+')[0]
-                local_datetime_obj = datetime.fromisoformat(base)
-                local_datetime_obj = local_datetime_obj.replace(
-                    tzinfo=dt_timezone(timedelta(minutes=self._offset_minutes))
-                )
+            local_datetime_obj = self._parse_localtime(localtime_str)
+            if local_datetime_obj.tzinfo is None:
+                # If no timezone info, assume fixed offset
+                local_datetime_obj = local_datetime_obj.replace(tzinfo=self._local_tz)
 
             # Convert to UTC
             return local_datetime_obj.astimezone(dt_timezone.utc)
@@ -135,6 +161,24 @@ class Localization:
             PrintStyle.error(f"Error converting localtime string to UTC: {e}")
             return None
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_localtime(localtime_str: str) -> datetime:
+        """Parse an ISO string, preferring ciso8601 and falling back to the stdlib parser.
+        Memoized, agents tend to repeat the same deadline strings; datetimes are immutable.
+        """
+        if _parse_iso_datetime is not None:
+            try:
+                return _parse_iso_datetime(localtime_str)
+            except ValueError:
+                pass
+        try:
+            # Try parsing with timezone info first
+            return datetime.fromisoformat(localtime_str)
+        except ValueError:
+            # If timezone parsing fails, strip the suffix and parse once without timezone
+            return datetime.fromisoformat(_TZ_SUFFIX_RE.sub("", localtime_str, count=1))
+
     def utc_dt_to_localtime_str(self, utc_dt: datetime | None, sep: str = "T", timespec: str = "auto") -> str | None:
         """
         Convert a UTC datetime object to a local time ISO string using the fixed UTC offset.
@@ -150,12 +194,15 @@ class Localization:
             # Ensure datetime is timezone aware in UTC
             if utc_dt.tzinfo is None:
                 utc_dt = utc_dt.replace(tzinfo=dt_timezone.utc)
-            else:
+            elif utc_dt.tzinfo is not dt_timezone.utc:
                 utc_dt = utc_dt.astimezone(dt_timezone.utc)
 
+            # Local time is UTC: no conversion needed
+            if self._offset_minutes == 0:
+                return utc_dt.isoformat(sep=sep, timespec=timespec)
+
             # Convert to local time using fixed offset
-            local_tz = dt_timezone(timedelta(minutes=self._offset_minutes))
-            local_datetime_obj = utc_dt.astimezone(local_tz)
+            local_datetime_obj = utc_dt.astimezone(self._local_tz)
             return local_datetime_obj.isoformat(sep=sep, timespec=timespec)
         except Exception as e:
             PrintStyle.error(f"Error converting UTC datetime to localtime string: {e}")
@@ -177,8 +224,11 @@ class Localization:
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=dt_timezone.utc)
 
-            local_tz = dt_timezone(timedelta(minutes=self._offset_minutes))
-            local_dt = dt.astimezone(local_tz)
+            # Already in UTC and local time is UTC: no conversion needed
+            if self._offset_minutes == 0 and dt.tzinfo is dt_timezone.utc:
+                return dt.isoformat()
+
+            local_dt = dt.astimezone(self._local_tz)
             return local_dt.isoformat()
         except Exception as e:
             PrintStyle.error(f"Error serializing datetime: {e}")
@@ -1,13 +1,22 @@
 from python.helpers import dotenv
 import hashlib
 
+# (user, password, hexdigest) of the last computed credentials hash
+_cred_cache: tuple[str, str | None, str] | None = None
+
 
 def get_credentials_hash():
+    global _cred_cache
     user = dotenv.get_dotenv_value("AUTH_LOGIN")
     password = dotenv.get_dotenv_value("AUTH_PASSWORD")
     if not user:
         return None
-    return hashlib.sha256(f"{user}:{password}".encode()).hexdigest()
+    if _cred_cache and _cred_cache[0] == user and _cred_cache[1] == password:
+        return _cred_cache[2]
+    # str(password) keeps the digest identical to the former f"{user}:{password}" form
+    digest = hashlib.sha256(user.encode() + b":" + str(password).encode()).hexdigest()
+    _cred_cache = (user, password, digest)
+    return digest
 
 
 def is_login_required():
@@ -7,11 +7,11 @@ including settings for intelligent tool selection and fallback options.
 
 import json
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, fields, replace
 from python.helpers.settings import get_settings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCPToolSelectionConfig:
     """Configuration for MCP tool selection behavior"""
     
@@ -51,10 +51,12 @@ class MCPConfigManager:
     
     def __init__(self):
         self._config: Optional[MCPToolSelectionConfig] = None
-        self._load_config()
+        self._config_dict_cache: Optional[Dict[str, Any]] = None
+        # configuration is loaded lazily on first access
     
     def _load_config(self):
         """Load configuration from settings"""
+        self._config_dict_cache = None
         try:
             settings = get_settings()
             mcp_settings = settings.get('mcp', {})
@@ -77,43 +79,60 @@ class MCPConfigManager:
             PrintStyle().print(f"Error loading MCP config, using defaults: {e}")
             self._config = MCPToolSelectionConfig()
     
+    def _ensure_config(self) -> MCPToolSelectionConfig:
+        """Load configuration on first access"""
+        if self._config is None:
+            self._load_config()
+        return self._config  # type: ignore
+
     def get_config(self) -> MCPToolSelectionConfig:
         """Get the current MCP configuration"""
-        return self._config if self._config else MCPToolSelectionConfig()
+        return self._ensure_config()
     
     def update_config(self, updates: Dict[str, Any]):
         """Update configuration with new values"""
-        if self._config is None:
-            self._config = MCPToolSelectionConfig()
-        
-        for key, value in updates.items():
-            if hasattr(self._config, key):
-                setattr(self._config, key, value)
+        config = self._ensure_config()
+        known = {f.name for f in fields(config)}
+        # config is immutable, swap in a replacement instead of mutating it
+        self._config = replace(config, **{k: v for k, v in updates.items() if k in known})
+        self._config_dict_cache = None
+
+    def get_config_dict(self) -> Dict[str, Any]:
+        """Get the current MCP configuration as a dictionary, cached until the next update"""
+        if self._config_dict_cache is None:
+            self._config_dict_cache = asdict(self.get_config())
+        return dict(self._config_dict_cache)
     
     def is_intelligent_selection_enabled(self) -> bool:
         """Check if intelligent tool selection is enabled"""
-        return self._config.enable_intelligent_selection if self._config else True
+        return self._ensure_config().enable_intelligent_selection
     
     def get_max_tools_in_prompt(self) -> int:
         """Get maximum number of tools to include in prompt"""
-        return self._config.max_tools_in_prompt if self._config else 15
+        return self._ensure_config().max_tools_in_prompt
     
     def should_fallback_to_static(self) -> bool:
         """Check if should fallback to static prompt"""
-        return self._config.fallback_to_static if self._config else True
+        return self._ensure_config().fallback_to_static
     
     def is_debug_mode(self) -> bool:
         """Check if debug mode is enabled"""
-        return self._config.debug_mode if self._config else False
+        return self._ensure_config().debug_mode
 
 
 # Global instance
 _config_manager = MCPConfigManager()
 
+# Memoized immutable config, replaced on update
+_current_config: Optional[MCPToolSelectionConfig] = None
+
 
 def get_mcp_config() -> MCPToolSelectionConfig:
     """Get the global MCP configuration"""
-    return _config_manager.get_config()
+    global _current_config
+    if _current_config is None:
+        _current_config = _config_manager.get_config()
+    return _current_config
 
 
 def is_intelligent_selection_enabled() -> bool:
@@ -138,22 +157,12 @@ def is_debug_mode() -> bool:
 
 def update_mcp_config(updates: Dict[str, Any]):
     """Update MCP configuration"""
+    global _current_config
     _config_manager.update_config(updates)
+    _current_config = _config_manager.get_config()
 
 
 # Utility function to get configuration as dict for API endpoints
 def get_mcp_config_dict() -> Dict[str, Any]:
     """Get MCP configuration as dictionary"""
-    config = get_mcp_config()
-    return {
-        'enable_intelligent_selection': config.enable_intelligent_selection,
-        'max_tools_in_prompt': config.max_tools_in_prompt,
-        'min_relevance_threshold': config.min_relevance_threshold,
-        'enable_caching': config.enable_caching,
-        'cache_ttl_hours': config.cache_ttl_hours,
-        'fallback_to_static': config.fallback_to_static,
-        'include_confidence_scores': config.include_confidence_scores,
-        'include_use_cases': config.include_use_cases,
-        'group_by_category': config.group_by_category,
-        'debug_mode': config.debug_mode
-    }
+    return _config_manager.get_config_dict()
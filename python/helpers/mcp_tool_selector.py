@@ -7,17 +7,109 @@ based on the current task context.
 """
 
 import re
-import json
+import heapq
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
 import threading
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from python.helpers.print_style import PrintStyle
 from python.helpers.mcp_handler import MCPConfig
 
 
+# Precompiled patterns shared by all analyzers and selectors
+_WORD_RE = re.compile(r'\b\w+\b')
+_USE_CASE_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        r'used to (\w+)',
+        r'(\w+) the',
+        r'(\w+) a',
+        r'(\w+) an',
+        r'can (\w+)',
+        r'allows you to (\w+)',
+        r'helps (\w+)',
+    )
+]
+
+# Common words ignored when extracting tool keywords
+_STOPWORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'must', 'shall', 'a', 'an', 'as', 'if', 'then', 'else', 'when', 'where', 'why', 'how', 'what', 'which', 'who', 'whom', 'whose', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'})
+
+
+def _build_keyword_matcher(labels: Dict[str, List[str]]) -> Tuple["re.Pattern[str]", Dict[str, frozenset]]:
+    """
+    Build a single regex that finds every keyword occurrence (substring semantics,
+    overlapping) in one scan, plus a map from matched keyword to its labels.
+    Longer keywords win at a given position, so each keyword also carries the
+    labels of all keywords contained in it.
+    """
+    keyword_labels: Dict[str, set] = defaultdict(set)
+    for label, keywords in labels.items():
+        for keyword in keywords:
+            keyword_labels[keyword].add(label)
+
+    closure = {
+        keyword: frozenset(
+            label for other, other_labels in keyword_labels.items() if other in keyword for label in other_labels
+        )
+        for keyword in keyword_labels
+    }
+    ordered = sorted(keyword_labels, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+    return pattern, closure
+
+
+def _match_keywords(pattern: "re.Pattern[str]", keyword_labels: Dict[str, frozenset], text: str) -> set:
+    """Return all labels whose keywords occur anywhere in text"""
+    matched = set()
+    for keyword in pattern.findall(text):
+        matched |= keyword_labels[keyword]
+    return matched
+
+
+# Task type indicators, in priority order
+_TASK_TYPES = {
+    'search': ['search', 'find', 'look for', 'query'],
+    'analysis': ['analyze', 'understand', 'explain', 'review'],
+    'creation': ['create', 'make', 'build', 'generate', 'write'],
+    'troubleshooting': ['fix', 'debug', 'solve', 'repair'],
+    'processing': ['process', 'transform', 'convert', 'format'],
+    'testing': ['test', 'validate', 'check', 'verify'],
+}
+
+# Capability indicators in user messages
+_CAPABILITY_HINTS = {
+    'web_search': ['web', 'internet', 'online', 'website'],
+    'code_analysis': ['code', 'programming', 'software', 'app'],
+    'file_operations': ['file', 'document', 'data'],
+    'research': ['research', 'study', 'investigate'],
+}
+
+_TASK_TYPE_RE, _TASK_TYPE_LABELS = _build_keyword_matcher(_TASK_TYPES)
+_CAPABILITY_RE, _CAPABILITY_LABELS = _build_keyword_matcher(_CAPABILITY_HINTS)
+
+
+def _iter_schema_strings(value: Any):
+    """Yield every key and string leaf of a JSON-like schema"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield str(key)
+            yield from _iter_schema_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_schema_strings(item)
+
+
+@lru_cache(maxsize=None)
+def _keyword_matcher_for(analyzer_cls: type) -> Tuple["re.Pattern[str]", Dict[str, frozenset]]:
+    """Build the keyword matcher once per analyzer class"""
+    return _build_keyword_matcher(analyzer_cls.CATEGORIES)
+
+
 @dataclass
 class ToolCapability:
     """Represents a tool's capabilities and metadata"""
@@ -30,6 +122,16 @@ class ToolCapability:
     output_types: List[str] = field(default_factory=list)
     use_cases: List[str] = field(default_factory=list)
     confidence_score: float = 0.0
+    # Precomputed for relevance scoring
+    keyword_set: frozenset = field(default_factory=frozenset, init=False, repr=False, compare=False)
+    # Precomputed for prompt generation
+    input_types_str: str = field(default="", init=False, repr=False, compare=False)
+    output_types_str: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.keyword_set = frozenset(self.keywords)
+        self.input_types_str = ', '.join(self.input_types)
+        self.output_types_str = ', '.join(self.output_types)
 
 
 @dataclass
@@ -40,6 +142,7 @@ class ToolContext:
     keywords: List[str] = field(default_factory=list)
     required_capabilities: List[str] = field(default_factory=list)
     excluded_categories: List[str] = field(default_factory=list)
+    keyword_set: frozenset = field(default_factory=frozenset, repr=False, compare=False)
 
 
 class ToolCapabilityAnalyzer:
@@ -61,110 +164,115 @@ class ToolCapabilityAnalyzer:
         "automation": ["automate", "workflow", "pipeline", "schedule", "trigger"],
     }
     
+    # Upper bound on cached tool analyses
+    CACHE_MAX_SIZE = 4096
+    
     def __init__(self):
-        self._capability_cache: Dict[str, ToolCapability] = {}
+        # tool key -> (capability, analyzed at); a single value so reads need no lock
+        self._capability_cache: Dict[str, Tuple[ToolCapability, datetime]] = {}
         self._cache_lock = threading.Lock()
-        self._cache_timestamp: Dict[str, datetime] = {}
         self._cache_ttl = timedelta(hours=1)  # Cache for 1 hour
+        self._keyword_re, self._keyword_categories = _keyword_matcher_for(type(self))
     
     def analyze_tool(self, tool: Dict[str, Any], server_name: str) -> ToolCapability:
         """Analyze a single tool to extract its capabilities"""
         tool_name = tool.get('name', '')
         tool_key = f"{server_name}.{tool_name}"
         
-        # Check cache first
-        with self._cache_lock:
-            if tool_key in self._capability_cache:
-                timestamp = self._cache_timestamp.get(tool_key, datetime.min)
-                if datetime.now() - timestamp < self._cache_ttl:
-                    return self._capability_cache[tool_key]
+        # Check cache first (lock-free, dict.get of a single tuple value is atomic)
+        cached = self._capability_cache.get(tool_key)
+        if cached is not None and datetime.now() - cached[1] < self._cache_ttl:
+            return cached[0]
         
         # Extract information from tool schema
         description = tool.get('description', '')
         input_schema = tool.get('input_schema', {})
         
         # Analyze capabilities
-        categories = self._categorize_tool(tool_name, description, input_schema)
-        keywords = self._extract_keywords(tool_name, description, input_schema)
-        input_types = self._extract_input_types(input_schema)
-        output_types = self._extract_output_types(description)
-        use_cases = self._extract_use_cases(description)
+        analysis = self._analyze_text(tool_name, description, input_schema)
         
         capability = ToolCapability(
             name=tool_name,
             server=server_name,
             description=description,
-            categories=categories,
-            keywords=keywords,
-            input_types=input_types,
-            output_types=output_types,
-            use_cases=use_cases,
-            confidence_score=self._calculate_confidence(categories, keywords)
+            categories=analysis['categories'],
+            keywords=analysis['keywords'],
+            input_types=analysis['input_types'],
+            output_types=analysis['output_types'],
+            use_cases=analysis['use_cases'],
+            confidence_score=self._calculate_confidence(analysis['categories'], analysis['keywords'])
         )
         
         # Cache the result
         with self._cache_lock:
-            self._capability_cache[tool_key] = capability
-            self._cache_timestamp[tool_key] = datetime.now()
+            # Re-insert so dict order stays oldest-first for eviction
+            self._capability_cache.pop(tool_key, None)
+            self._capability_cache[tool_key] = (capability, datetime.now())
+            if len(self._capability_cache) > self.CACHE_MAX_SIZE:
+                self._evict_cache()
         
         return capability
     
-    def _categorize_tool(self, name: str, description: str, input_schema: Dict) -> List[str]:
-        """Categorize the tool based on its name, description, and schema"""
+    def _evict_cache(self):
+        """Drop expired entries, then the oldest ones while over the size bound (caller holds the lock)"""
+        now = datetime.now()
+        for key in [k for k, (_, ts) in self._capability_cache.items() if now - ts >= self._cache_ttl]:
+            del self._capability_cache[key]
+        while len(self._capability_cache) > self.CACHE_MAX_SIZE:
+            del self._capability_cache[next(iter(self._capability_cache))]
+    
+    def _analyze_text(self, name: str, description: str, input_schema: Dict) -> Dict[str, List[str]]:
+        """
+        Extract categories, keywords, input/output types and use cases together,
+        lowercasing and tokenizing the tool text once and walking the schema properties once.
+        """
         text = f"{name} {description}".lower()
-        categories = []
+        description_lower = description.lower()
         
-        for category, keywords in self.CATEGORIES.items():
-            if any(keyword in text for keyword in keywords):
-                categories.append(category)
+        # Categorize based on name and description
+        matched = self._match_categories(text)
+        categories = [category for category in self.CATEGORIES if category in matched]
         
         # Analyze input schema for additional clues
-        schema_str = json.dumps(input_schema).lower()
-        for category, keywords in self.CATEGORIES.items():
-            if any(keyword in schema_str for keyword in keywords):
-                if category not in categories:
-                    categories.append(category)
-        
-        return categories or ["general"]
-    
-    def _extract_keywords(self, name: str, description: str, input_schema: Dict) -> List[str]:
-        """Extract relevant keywords from tool information"""
-        text = f"{name} {description}".lower()
+        schema_matched = self._match_categories(" ".join(_iter_schema_strings(input_schema)).lower())
+        for category in self.CATEGORIES:
+            if category in schema_matched and category not in matched:
+                categories.append(category)
         
         # Extract words that are likely meaningful
-        words = re.findall(r'\b\w+\b', text)
+        words = _WORD_RE.findall(text)
         
         # Filter out common words and keep relevant ones
-        common_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'must', 'shall', 'a', 'an', 'as', 'if', 'then', 'else', 'when', 'where', 'why', 'how', 'what', 'which', 'who', 'whom', 'whose', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'}
-        
-        keywords = [word for word in words if len(word) > 2 and word not in common_words]
-        
-        # Extract property names from input schema
-        if 'properties' in input_schema:
-            for prop_name in input_schema['properties'].keys():
-                keywords.append(prop_name.lower())
-        
-        return list(set(keywords))
-    
-    def _extract_input_types(self, input_schema: Dict) -> List[str]:
-        """Extract input data types from schema"""
-        types = []
+        keywords = [word for word in words if len(word) > 2 and word not in _STOPWORDS]
         
+        # Property names become keywords, property types become input types
+        input_types = []
         if 'type' in input_schema:
-            types.append(input_schema['type'])
+            input_types.append(input_schema['type'])
         
         if 'properties' in input_schema:
-            for prop in input_schema['properties'].values():
+            for prop_name, prop in input_schema['properties'].items():
+                keywords.append(prop_name.lower())
                 if 'type' in prop:
-                    types.append(prop['type'])
+                    input_types.append(prop['type'])
                 if 'enum' in prop:
-                    types.append('enum')
-        
-        return list(set(types))
+                    input_types.append('enum')
+        
+        return {
+            'categories': categories or ["general"],
+            'keywords': list(set(keywords)),
+            'input_types': list(set(input_types)),
+            'output_types': self._extract_output_types(description_lower),
+            'use_cases': self._extract_use_cases(description_lower),
+        }
+    
+    def _match_categories(self, text: str) -> set:
+        """Return all categories whose keywords occur anywhere in text"""
+        return _match_keywords(self._keyword_re, self._keyword_categories, text)
     
-    def _extract_output_types(self, description: str) -> List[str]:
-        """Extract output data types from description"""
-        text = description.lower()
+    def _extract_output_types(self, description_lower: str) -> List[str]:
+        """Extract output data types from the lowercased description"""
+        text = description_lower
         output_types = []
         
         if any(word in text for word in ['json', 'object', 'data']):
@@ -180,25 +288,12 @@ class ToolCapabilityAnalyzer:
         
         return output_types or ['text']
     
-    def _extract_use_cases(self, description: str) -> List[str]:
-        """Extract potential use cases from description"""
+    def _extract_use_cases(self, description_lower: str) -> List[str]:
+        """Extract potential use cases from the lowercased description"""
         # Look for action phrases and patterns
         use_cases = []
-        
-        # Common patterns
-        patterns = [
-            r'used to (\w+)',
-            r'(\w+) the',
-            r'(\w+) a',
-            r'(\w+) an',
-            r'can (\w+)',
-            r'allows you to (\w+)',
-            r'helps (\w+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, description.lower())
-            use_cases.extend(matches)
+        for pattern in _USE_CASE_PATTERNS:
+            use_cases.extend(pattern.findall(description_lower))
         
         return list(set(use_cases))
     
@@ -220,8 +315,9 @@ class ContextAwareToolSelector:
     
     def __init__(self):
         self.analyzer = ToolCapabilityAnalyzer()
-        self._context_cache: Dict[str, List[ToolCapability]] = {}
         self._cache_lock = threading.Lock()
+        # (server name, tool list) pairs the analyzed tools were built from, and the result
+        self._all_tools_cache: Optional[Tuple[List[Tuple[str, List[Dict[str, Any]]]], List[ToolCapability]]] = None
     
     def analyze_context(self, user_message: str, task_history: Optional[List[str]] = None) -> ToolContext:
         """Analyze the current task context"""
@@ -229,8 +325,9 @@ class ContextAwareToolSelector:
         context.user_message = user_message.lower()
         
         # Extract keywords from user message
-        words = re.findall(r'\b\w+\b', context.user_message)
+        words = _WORD_RE.findall(context.user_message)
         context.keywords = [word for word in words if len(word) > 3]
+        context.keyword_set = frozenset(context.keywords)
         
         # Determine task type based on keywords
         context.task_type = self._determine_task_type(context.user_message, context.keywords)
@@ -243,82 +340,107 @@ class ContextAwareToolSelector:
     def select_tools(self, context: ToolContext, max_tools: int = 10) -> List[ToolCapability]:
         """Select the most relevant tools for the given context"""
         # Get all available tools
+        all_tools = self._get_all_tools()
+        
+        # Score tools based on relevance, sharing the per-request category weights
+        category_weights: Dict[str, float] = {}
+        scored_tools = []
+        for tool in all_tools:
+            score = self._calculate_relevance_score(tool, context, category_weights)
+            if score > 0.1:  # Only consider tools with some relevance
+                scored_tools.append((tool, score))
+        
+        # Keep only the top tools by score (stable, same order as a full sort)
+        top_tools = heapq.nlargest(max_tools, scored_tools, key=lambda x: x[1])
+        return [tool for tool, score in top_tools]
+    
+    def _get_all_tools(self) -> List[ToolCapability]:
+        """Analyze all available tools, reusing the last result while no server's tool list has changed"""
         mcp_config = MCPConfig.get_instance()
-        all_tools = []
+        server_tools: List[Tuple[str, List[Dict[str, Any]]]] = []
+        complete = True
         
         for server in mcp_config.servers:
             try:
-                server_tools = server.get_tools()
-                for tool in server_tools:
-                    capability = self.analyzer.analyze_tool(tool, server.name)
-                    all_tools.append(capability)
+                server_tools.append((server.name, server.get_tools()))
             except Exception as e:
                 PrintStyle().print(f"Error analyzing tools from server {server.name}: {e}")
+                complete = False
         
-        # Score tools based on relevance
-        scored_tools = []
-        for tool in all_tools:
-            score = self._calculate_relevance_score(tool, context)
-            if score > 0.1:  # Only consider tools with some relevance
-                scored_tools.append((tool, score))
+        # Servers hand out a new tool list whenever their tools are refreshed
+        cached = self._all_tools_cache
+        if cached is not None and len(cached[0]) == len(server_tools) and all(
+            old_name == name and old_tools is tools
+            for (old_name, old_tools), (name, tools) in zip(cached[0], server_tools)
+        ):
+            return cached[1]
         
-        # Sort by score and return top tools
-        scored_tools.sort(key=lambda x: x[1], reverse=True)
-        return [tool for tool, score in scored_tools[:max_tools]]
+        all_tools = []
+        for server_name, tools in server_tools:
+            try:
+                for tool in tools:
+                    capability = self.analyzer.analyze_tool(tool, server_name)
+                    all_tools.append(capability)
+            except Exception as e:
+                PrintStyle().print(f"Error analyzing tools from server {server_name}: {e}")
+                complete = False
+        
+        # Only reuse results that cover every server
+        if complete:
+            with self._cache_lock:
+                self._all_tools_cache = (server_tools, all_tools)
+        
+        return all_tools
     
     def _determine_task_type(self, message: str, keywords: List[str]) -> str:
         """Determine the type of task based on the message"""
-        message_lower = message.lower()
-        
-        if any(word in message_lower for word in ['search', 'find', 'look for', 'query']):
-            return 'search'
-        elif any(word in message_lower for word in ['analyze', 'understand', 'explain', 'review']):
-            return 'analysis'
-        elif any(word in message_lower for word in ['create', 'make', 'build', 'generate', 'write']):
-            return 'creation'
-        elif any(word in message_lower for word in ['fix', 'debug', 'solve', 'repair']):
-            return 'troubleshooting'
-        elif any(word in message_lower for word in ['process', 'transform', 'convert', 'format']):
-            return 'processing'
-        elif any(word in message_lower for word in ['test', 'validate', 'check', 'verify']):
-            return 'testing'
-        else:
-            return 'general'
+        matched = _match_keywords(_TASK_TYPE_RE, _TASK_TYPE_LABELS, message.lower())
+        for task_type in _TASK_TYPES:
+            if task_type in matched:
+                return task_type
+        return 'general'
     
     def _extract_required_capabilities(self, message: str) -> List[str]:
         """Extract required capabilities from the message"""
-        capabilities = []
-        message_lower = message.lower()
-        
-        # Look for capability indicators
-        if any(word in message_lower for word in ['web', 'internet', 'online', 'website']):
-            capabilities.append('web_search')
-        if any(word in message_lower for word in ['code', 'programming', 'software', 'app']):
-            capabilities.append('code_analysis')
-        if any(word in message_lower for word in ['file', 'document', 'data']):
-            capabilities.append('file_operations')
-        if any(word in message_lower for word in ['research', 'study', 'investigate']):
-            capabilities.append('research')
-        
-        return capabilities
+        matched = _match_keywords(_CAPABILITY_RE, _CAPABILITY_LABELS, message.lower())
+        return [capability for capability in _CAPABILITY_HINTS if capability in matched]
+    
+    def _category_weight(self, category: str, context: ToolContext) -> float:
+        """Score contribution of a single tool category in the given context"""
+        if category in context.required_capabilities:
+            return 0.4
+        elif context.task_type == 'search' and category == 'web_search':
+            return 0.3
+        elif context.task_type == 'analysis' and category in ['code_analysis', 'research']:
+            return 0.3
+        elif context.task_type == 'creation' and category in ['content', 'ai_ml']:
+            return 0.3
+        return 0.0
     
-    def _calculate_relevance_score(self, tool: ToolCapability, context: ToolContext) -> float:
-        """Calculate relevance score for a tool given the context"""
+    def _calculate_relevance_score(
+        self,
+        tool: ToolCapability,
+        context: ToolContext,
+        category_weights: Optional[Dict[str, float]] = None,
+    ) -> float:
+        """
+        Calculate relevance score for a tool given the context.
+        category_weights is a per-context lookup table filled on demand; pass the
+        same dict when scoring many tools against one context.
+        """
+        if category_weights is None:
+            category_weights = {}
         score = 0.0
         
         # Category matching
         for category in tool.categories:
-            if category in context.required_capabilities:
-                score += 0.4
-            elif context.task_type == 'search' and category == 'web_search':
-                score += 0.3
-            elif context.task_type == 'analysis' and category in ['code_analysis', 'research']:
-                score += 0.3
-            elif context.task_type == 'creation' and category in ['content', 'ai_ml']:
-                score += 0.3
+            weight = category_weights.get(category)
+            if weight is None:
+                weight = category_weights[category] = self._category_weight(category, context)
+            score += weight
         
         # Keyword matching
-        keyword_matches = len(set(tool.keywords) & set(context.keywords))
+        keyword_matches = len(tool.keyword_set & context.keyword_set)
         score += keyword_matches * 0.1
         
         # Use case matching
@@ -340,8 +462,8 @@ class DynamicToolPromptGenerator:
         if not selected_tools:
             return "## No relevant MCP tools available for this task.\n"
         
-        prompt = '## "Intelligently Selected MCP Tools" for your task:\n\n'
-        prompt += f"**Task Context:** {context.task_type} task with keywords: {', '.join(context.keywords[:5])}\n\n"
+        parts = ['## "Intelligently Selected MCP Tools" for your task:\n\n']
+        parts.append(f"**Task Context:** {context.task_type} task with keywords: {', '.join(context.keywords[:5])}\n\n")
         
         # Group tools by category
         tools_by_category = defaultdict(list)
@@ -350,51 +472,53 @@ class DynamicToolPromptGenerator:
                 tools_by_category[category].append(tool)
         
         for category, tools in tools_by_category.items():
-            prompt += f"### {category.replace('_', ' ').title()} Tools\n\n"
+            parts.append(f"### {category.replace('_', ' ').title()} Tools\n\n")
             
             for tool in tools:
-                prompt += f"#### **{tool.server}.{tool.name}**\n"
-                prompt += f"{tool.description}\n\n"
+                parts.append(f"#### **{tool.server}.{tool.name}**\n")
+                parts.append(f"{tool.description}\n\n")
                 
                 # Add capability insights
                 if tool.use_cases:
-                    prompt += f"**Use Cases:** {', '.join(tool.use_cases[:3])}\n\n"
+                    parts.append(f"**Use Cases:** {', '.join(tool.use_cases[:3])}\n\n")
                 
                 # Add input/output information
                 if tool.input_types:
-                    prompt += f"**Input Types:** {', '.join(tool.input_types)}\n\n"
+                    parts.append(f"**Input Types:** {tool.input_types_str}\n\n")
                 
                 if tool.output_types:
-                    prompt += f"**Output Types:** {', '.join(tool.output_types)}\n\n"
+                    parts.append(f"**Output Types:** {tool.output_types_str}\n\n")
                 
                 # Add relevance score
-                prompt += f"**Relevance:** {tool.confidence_score:.2f}\n\n"
+                parts.append(f"**Relevance:** {tool.confidence_score:.2f}\n\n")
                 
-                prompt += "---\n\n"
+                parts.append("---\n\n")
         
         # Add usage guidance
-        prompt += "### Usage Guidance\n"
-        prompt += f"Based on your {context.task_type} task, these tools are most relevant. "
-        prompt += "Start with the highest relevance tools and consider the use cases listed above.\n"
+        parts.append("### Usage Guidance\n")
+        parts.append(f"Based on your {context.task_type} task, these tools are most relevant. ")
+        parts.append("Start with the highest relevance tools and consider the use cases listed above.\n")
         
-        return prompt
+        return ''.join(parts)
+
+
+# Shared instances so analyzer and tool-list caches stay warm across calls
+_SELECTOR = ContextAwareToolSelector()
+_GENERATOR = DynamicToolPromptGenerator()
 
 
 # Main integration function
 def get_intelligent_mcp_prompt(user_message: str = "", max_tools: int = 10) -> str:
     """Get an intelligent MCP tools prompt based on the current context"""
     try:
-        selector = ContextAwareToolSelector()
-        
         # Analyze context
-        context = selector.analyze_context(user_message)
+        context = _SELECTOR.analyze_context(user_message)
         
         # Select relevant tools
-        selected_tools = selector.select_tools(context, max_tools)
+        selected_tools = _SELECTOR.select_tools(context, max_tools)
         
         # Generate dynamic prompt
-        generator = DynamicToolPromptGenerator()
-        return generator.generate_prompt(selected_tools, context)
+        return _GENERATOR.generate_prompt(selected_tools, context)
         
     except Exception as e:
         PrintStyle().print(f"Error generating intelligent MCP prompt: {e}")
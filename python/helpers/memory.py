@@ -1,4 +1,6 @@
+import ast
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, List, Sequence
 from langchain.storage import InMemoryByteStore, LocalFileStore
 from langchain.embeddings import CacheBackedEmbeddings
@@ -31,6 +33,7 @@ from . import files
 from langchain_core.documents import Document
 from python.helpers import knowledge_import
 from python.helpers.log import Log, LogItem
+from python.helpers.memory_query_cache import query_cache
 from enum import Enum
 from agent import Agent, AgentContext
 import models
@@ -58,6 +61,35 @@ class MyFaiss(FAISS):
     def get_all_docs(self):
         return self.docstore._dict  # type: ignore
 
+    # faiss ids grouped by memory area, rebuilt when the index size changes or on save
+    _area_ids: dict[str, np.ndarray] | None = None
+    _area_ids_total = -1
+
+    def get_area_ids(self) -> dict[str, np.ndarray]:
+        if self._area_ids is None or self._area_ids_total != self.index.ntotal:
+            grouped: dict[str, list[int]] = {}
+            docs = self.get_all_docs()
+            for i, doc_id in self.index_to_docstore_id.items():
+                doc = docs.get(doc_id)
+                area = doc.metadata.get("area") if doc else None
+                if area is not None:
+                    grouped.setdefault(area, []).append(i)
+            self._area_ids = {
+                area: np.array(ids, dtype=np.int64) for area, ids in grouped.items()
+            }
+            self._area_ids_total = self.index.ntotal
+        return self._area_ids
+
+    def get_vectors(self) -> np.ndarray:
+        # view of the flat index storage, row i is faiss id i, only valid until the next write
+        index = self.index
+        return faiss.rev_swig_ptr(index.get_xb(), index.ntotal * index.d).reshape(
+            index.ntotal, index.d
+        )
+
+    def clear_search_caches(self):
+        self._area_ids = None
+
 
 class Memory:
     class Area(Enum):
@@ -130,6 +162,7 @@ class Memory:
         memory_subdir = get_agent_memory_subdir(agent)
         if Memory.index.get(memory_subdir):
             del Memory.index[memory_subdir]
+        query_cache.invalidate(memory_subdir)
         return await Memory.get(agent)
 
     @staticmethod
@@ -344,18 +377,87 @@ class Memory:
     def get_document_by_id(self, id: str) -> Document | None:
         return self.db.get_by_ids(id)[0]
 
+    async def embed_query(self, query: str) -> list[float]:
+        return await self.db.embedding_function.aembed_query(query)  # type: ignore
+
     async def search_similarity_threshold(
-        self, query: str, limit: int, threshold: float, filter: str = ""
+        self,
+        query: str,
+        limit: int,
+        threshold: float,
+        filter: str = "",
+        embedding: list[float] | None = None,
     ):
-        comparator = Memory._get_comparator(filter) if filter else None
-
-        return await self.db.asearch(
-            query,
-            search_type="similarity_score_threshold",
-            k=limit,
-            score_threshold=threshold,
-            filter=comparator,
+        areas = _parse_area_filter(filter) if filter else None
+        if not filter or areas is not None:
+            if embedding is None:
+                embedding = await self.embed_query(query)
+            ids = None
+            if areas is not None:
+                # filter on area only, search just the vectors of those areas
+                area_ids = self.db.get_area_ids()
+                found = [area_ids[area] for area in areas if area in area_ids]
+                if not found:
+                    return []
+                ids = np.concatenate(found)
+            return self._search_vector(embedding, limit, threshold, ids)
+
+        comparator = Memory._get_comparator(filter)
+
+        if embedding is None:
+            return await self.db.asearch(
+                query,
+                search_type="similarity_score_threshold",
+                k=limit,
+                score_threshold=threshold,
+                filter=comparator,
+            )
+
+        # query already embedded by the caller, same scoring as asearch above
+        docs = await self.db.asimilarity_search_with_score_by_vector(
+            embedding, k=limit, filter=comparator
         )
+        return [
+            doc for doc, score in docs if Memory._cosine_normalizer(score) >= threshold
+        ]
+
+    def _search_vector(
+        self,
+        embedding: list[float],
+        limit: int,
+        threshold: float,
+        ids: np.ndarray | None = None,
+    ) -> list[Document]:
+        index = self.db.index
+        count = index.ntotal if ids is None else len(ids)
+        if not count or limit <= 0:
+            return []
+        query = np.array([embedding], dtype=np.float32)
+
+        # exact scores straight from the stored float vectors, one matrix-vector product
+        vectors = self.db.get_vectors()
+        if ids is None:
+            candidates = np.arange(count)
+            exact = vectors @ query[0]
+        else:
+            candidates = ids
+            exact = vectors[ids] @ query[0]
+
+        k = min(limit, len(exact))
+        if not k:
+            return []
+        top = np.argpartition(-exact, k - 1)[:k]
+        top = top[np.argsort(-exact[top])]
+        scores, indices = exact[top], candidates[top]
+
+        docs = []
+        for score, i in zip(scores, indices):
+            if Memory._cosine_normalizer(float(score)) < threshold:
+                continue
+            doc = self.db.docstore.search(self.db.index_to_docstore_id[int(i)])
+            if isinstance(doc, Document):
+                docs.append(doc)
+        return docs
 
     async def delete_documents_by_query(
         self, query: str, threshold: float, filter: str = ""
@@ -364,10 +466,16 @@ class Memory:
         tot = 0
         removed = []
 
+        # embed once for all pages
+        embedding = await self.embed_query(query)
+        if not filter or _parse_area_filter(filter) is not None:
+            # searched directly over every vector, one page holds all matches
+            k = max(k, self.db.index.ntotal)
+
         while True:
             # Perform similarity search with score
             docs = await self.search_similarity_threshold(
-                query, limit=k, threshold=threshold, filter=filter
+                query, limit=k, threshold=threshold, filter=filter, embedding=embedding
             )
             removed += docs
 
@@ -432,6 +540,9 @@ class Memory:
         return ins
 
     def _save_db(self):
+        # every write persists through here, so cached searches go stale now
+        query_cache.invalidate(self.memory_subdir)
+        self.db.clear_search_caches()
         Memory._save_db_file(self.db, self.memory_subdir)
 
     def _generate_doc_id(self):
@@ -472,20 +583,58 @@ class Memory:
 
     @staticmethod
     def format_docs_plain(docs: list[Document]) -> list[str]:
-        result = []
-        for doc in docs:
-            text = ""
-            for k, v in doc.metadata.items():
-                text += f"{k}: {v}\n"
-            text += f"Content: {doc.page_content}"
-            result.append(text)
-        return result
+        return [
+            "".join(f"{k}: {v}\n" for k, v in doc.metadata.items())
+            + f"Content: {doc.page_content}"
+            for doc in docs
+        ]
 
     @staticmethod
     def get_timestamp():
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+@lru_cache(maxsize=256)
+def _parse_area_filter(condition: str) -> frozenset[str] | None:
+    """
+    Areas matched by a filter that only compares the area, like "area == 'main'",
+    "area == 'main' or area == 'fragments'" or "area in ['main', 'solutions']".
+    None for any other filter, those are evaluated per document.
+    """
+
+    def areas(node: ast.AST) -> set[str] | None:
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.Or):
+            result = set()
+            for value in node.values:
+                sub = areas(value)
+                if sub is None:
+                    return None
+                result |= sub
+            return result
+        if not isinstance(node, ast.Compare) or len(node.ops) != 1:
+            return None
+        left, op, right = node.left, node.ops[0], node.comparators[0]
+        if isinstance(op, ast.Eq) and isinstance(right, ast.Name):
+            left, right = right, left  # 'main' == area
+        if not (isinstance(left, ast.Name) and left.id == "area"):
+            return None
+        if isinstance(op, ast.Eq):
+            values = [right]
+        elif isinstance(op, ast.In) and isinstance(right, (ast.List, ast.Tuple, ast.Set)):
+            values = right.elts
+        else:
+            return None
+        if not all(isinstance(v, ast.Constant) and isinstance(v.value, str) for v in values):
+            return None
+        return {v.value for v in values}  # type: ignore
+
+    try:
+        result = areas(ast.parse(condition.strip(), mode="eval").body)
+    except SyntaxError:
+        return None
+    return frozenset(result) if result is not None else None
+
+
 def get_custom_knowledge_subdir_abs(agent: Agent) -> str:
     for dir in agent.config.knowledge_subdirs:
         if dir != "default":
@@ -496,6 +645,7 @@ def get_custom_knowledge_subdir_abs(agent: Agent) -> str:
 def reload():
     # clear the memory index, this will force all DBs to reload
     Memory.index = {}
+    query_cache.invalidate()
 
 
 def abs_db_dir(memory_subdir: str) -> str:
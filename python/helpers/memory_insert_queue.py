@@ -0,0 +1,67 @@
+import asyncio
+
+from langchain_core.documents import Document
+
+from python.helpers.memory import Memory
+
+
+class MemoryInsertQueue:
+    """
+    Coalesces memory inserts that arrive within a short window into one insert_documents call,
+    so concurrent savers share a single embedding request, index update and save.
+    """
+
+    MAX_BATCH = 32
+    MAX_WAIT = 0.05  # seconds to wait for more inserts after the first one
+
+    # one queue per memory subdir and event loop, asyncio queues are bound to their loop
+    _queues: dict[tuple[str, asyncio.AbstractEventLoop], "MemoryInsertQueue"] = {}
+
+    @staticmethod
+    def get(db: Memory) -> "MemoryInsertQueue":
+        loop = asyncio.get_running_loop()
+        queues = MemoryInsertQueue._queues
+        for key in [k for k in queues if k[1].is_closed()]:
+            del queues[key]
+        queue = queues.get((db.memory_subdir, loop))
+        if queue is None:
+            queue = queues[(db.memory_subdir, loop)] = MemoryInsertQueue(db)
+        queue.db = db  # latest handle, the index may have been reloaded
+        return queue
+
+    def __init__(self, db: Memory):
+        self.db = db
+        self.queue: asyncio.Queue[tuple[Document, asyncio.Future]] = asyncio.Queue()
+        self.flusher: asyncio.Task | None = None
+
+    async def insert_text(self, text: str, metadata: dict | None = None) -> str:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((Document(text, metadata=metadata or {}), future))
+        if not self.flusher or self.flusher.done():
+            self.flusher = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self):
+        loop = asyncio.get_running_loop()
+        while not self.queue.empty():
+            batch = [self.queue.get_nowait()]
+            deadline = loop.time() + self.MAX_WAIT
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                ids = await self.db.insert_documents([doc for doc, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), id in zip(batch, ids):
+                    if not future.done():
+                        future.set_result(id)
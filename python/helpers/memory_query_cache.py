@@ -0,0 +1,169 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Sequence
+
+import numpy as np
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of memory search results with a time-to-live.
+    Results are found by exact query or, once the query is embedded, by a near-identical
+    query embedding. Entries are grouped by memory subdir, any write to a subdir drops its entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl_seconds: float = 300,
+        semantic_size: int = 256,
+        min_similarity: float = 0.97,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.semantic_size = semantic_size
+        self.min_similarity = min_similarity
+        # key -> (stored at, results), oldest first
+        self._entries: OrderedDict[tuple, tuple[float, list[Any]]] = OrderedDict()
+        # unit query embeddings, one row per semantic entry, allocated on first use
+        self._vectors: np.ndarray | None = None
+        # per row: (search key without query, stored at, results) or None when free
+        self._rows: list[tuple[tuple, float, list[Any]] | None] = [None] * semantic_size
+        self._row_used = np.zeros(semantic_size, dtype=np.int64)  # LRU clock per row
+        self._clock = 0
+        # bumped on every invalidation, so searches that raced a write are not stored
+        self._generations: dict[str, int] = {}
+        self._epoch = 0  # bumped when all subdirs are dropped at once
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _key(memory_subdir: str, query: str, threshold: float, limit: int, filter: str):
+        return (memory_subdir, query.strip(), float(threshold), int(limit), filter.strip())
+
+    def generation(self, memory_subdir: str) -> int:
+        # both counters only grow, so any invalidation changes the sum
+        return self._epoch + self._generations.get(memory_subdir, 0)
+
+    def get(
+        self, memory_subdir: str, query: str, threshold: float, limit: int, filter: str = ""
+    ) -> list[Any] | None:
+        key = self._key(memory_subdir, query, threshold, limit, filter)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(entry[1])
+
+    def get_similar(
+        self,
+        memory_subdir: str,
+        embedding: Sequence[float],
+        threshold: float,
+        limit: int,
+        filter: str = "",
+    ) -> list[Any] | None:
+        """Results of an earlier search with the same settings and a near-identical query."""
+        vector = self._unit(embedding)
+        key = self._key(memory_subdir, "", threshold, limit, filter)
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+                return None
+            now = time.monotonic()
+            candidates = [
+                i
+                for i, row in enumerate(self._rows)
+                if row and row[0] == key and now - row[1] < self.ttl_seconds
+            ]
+            if not candidates:
+                return None
+            sims = self._vectors[candidates] @ vector
+            best = int(np.argmax(sims))
+            if sims[best] < self.min_similarity:
+                return None
+            row_no = candidates[best]
+            self._clock += 1
+            self._row_used[row_no] = self._clock
+            self._semantic_hits += 1
+            return list(self._rows[row_no][2])  # type: ignore
+
+    def put(
+        self,
+        memory_subdir: str,
+        query: str,
+        threshold: float,
+        limit: int,
+        filter: str,
+        results: list[Any],
+        generation: int,
+        embedding: Sequence[float] | None = None,
+    ):
+        key = self._key(memory_subdir, query, threshold, limit, filter)
+        vector = self._unit(embedding) if embedding is not None else None
+        with self._lock:
+            if generation != self.generation(memory_subdir):
+                return  # the subdir changed while searching
+            now = time.monotonic()
+            self._entries[key] = (now, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+            if vector is None:
+                return
+            if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+                # first use or a different embedding model, start over
+                self._vectors = np.zeros((self.semantic_size, vector.shape[0]), dtype=np.float32)
+                self._rows = [None] * self.semantic_size
+                self._row_used[:] = 0
+            row_no = int(np.argmin(self._row_used))  # free rows are never used
+            self._vectors[row_no] = vector
+            self._rows[row_no] = (self._key(memory_subdir, "", threshold, limit, filter), now, list(results))
+            self._clock += 1
+            self._row_used[row_no] = self._clock
+
+    def invalidate(self, memory_subdir: str | None = None):
+        """Drop cached results of one memory subdir, or of all of them."""
+        with self._lock:
+            if memory_subdir is None:
+                self._entries.clear()
+                self._rows = [None] * self.semantic_size
+                self._row_used[:] = 0
+                self._epoch += 1
+                return
+            self._generations[memory_subdir] = self._generations.get(memory_subdir, 0) + 1
+            for key in [k for k in self._entries if k[0] == memory_subdir]:
+                del self._entries[key]
+            for i, row in enumerate(self._rows):
+                if row and row[0][0] == memory_subdir:
+                    self._rows[i] = None
+                    self._row_used[i] = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "semantic_hits": self._semantic_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._semantic_hits) / total if total else 0.0,
+            }
+
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+query_cache = QueryCache()
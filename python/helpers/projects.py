@@ -332,12 +332,29 @@ def get_context_memory_subdir(context: "AgentContext") -> str | None:
     # if a project is active and has memory isolation set, return the project memory subdir
     project_name = get_context_project_name(context)
     if project_name:
-        project_data = load_basic_project_data(project_name)
-        if project_data["memory"] == "own":
+        if _get_project_memory_setting(project_name) == "own":
             return "projects/" + project_name
     return None  # no memory override
 
 
+# project name -> (header file mtime, memory setting)
+_memory_settings: dict[str, tuple[float, str]] = {}
+
+
+def _get_project_memory_setting(name: str) -> str:
+    # every memory access resolves the subdir, so only re-read the header once it changed
+    abs_path = files.get_abs_path(
+        PROJECTS_PARENT_DIR, name, PROJECT_META_DIR, PROJECT_HEADER_FILE
+    )
+    mtime = os.path.getmtime(abs_path)
+    cached = _memory_settings.get(name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    setting = load_basic_project_data(name)["memory"]
+    _memory_settings[name] = (mtime, setting)
+    return setting
+
+
 def create_project_meta_folders(name: str):
     # create instructions folder
     files.create_dir(get_project_meta_folder(name, PROJECT_INSTRUCTIONS_DIR))
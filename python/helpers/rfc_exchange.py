@@ -1,15 +1,21 @@
+from functools import lru_cache
 from python.helpers import runtime, crypto, dotenv
 
 async def get_root_password():
     if runtime.is_dockerized():
         pswd = _get_root_password()
     else:
-        priv = crypto._generate_private_key()
-        pub = crypto._generate_public_key(priv)
+        priv, pub = _get_exchange_keys()
         enc = await runtime.call_development_function(_provide_root_password, pub)
         pswd = crypto.decrypt_data(enc, priv)
     return pswd
     
+@lru_cache(maxsize=1)
+def _get_exchange_keys():
+    # ephemeral keypair, kept for the process instead of an RSA keygen per shell
+    priv = crypto._generate_private_key()
+    return priv, crypto._generate_public_key(priv)
+
 def _provide_root_password(public_key_pem: str):
     pswd = _get_root_password()
     enc = crypto.encrypt_data(pswd, public_key_pem)
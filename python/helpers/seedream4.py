@@ -6,12 +6,36 @@ share it without duplicating literals in multiple places.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict
 
-from python.helpers import dotenv
+import httpx
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional, stdlib json is used without it
+    orjson = None
+
+from python.helpers import dotenv, files
 
 SEEDREAM4_ENDPOINT = "https://ark.ap-southeast.bytepluses.com/api/v3/images/generations"
 
+DEFAULT_NEGATIVE_PROMPT = "plastic skin, blurry details, cartoonish proportions, low resolution, unrealistic shadows, oversaturated colors"
+
+RESULT_CACHE_FILE = "export_zone/.seedream_cache.json"
+RESULT_CACHE_MAX = 128
+
+# request hash -> (stored at, raw response, saved images), oldest first, loaded from disk on first use
+_result_cache: OrderedDict[str, tuple[float, Any, list[dict[str, Any]]]] | None = None
+
+# pooled clients per event loop, httpx connections are bound to the loop that opened them
+_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
 
 def get_model_name() -> str:
     """Return the Seedream model name, env-overridable.
@@ -21,9 +45,6 @@ def get_model_name() -> str:
     return dotenv.get_dotenv_value("SEEDREAM4_MODEL", "seedream-4-5-251128")
 
 
-SEEDREAM4_MODEL = get_model_name()
-
-
 def is_enabled() -> bool:
     """Return True if Seedream4 integration is enabled via env flag."""
     enabled = (dotenv.get_dotenv_value("SEEDREAM4_ENABLED", "false") or "").lower()
@@ -35,18 +56,143 @@ def get_api_key() -> str | None:
     return dotenv.get_dotenv_value("SEEDREAM4_API_KEY") or None
 
 
+@lru_cache(maxsize=4)
 def build_headers(api_key: str) -> Dict[str, str]:
-    """Build HTTP headers for calling the Seedream4 API."""
+    """Build HTTP headers for calling the Seedream4 API.
+
+    The result is memoized per API key; treat the returned dict as read-only.
+    """
     return {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
     }
 
 
+def get_base_payload() -> Dict[str, Any]:
+    """Return the request template with per-call defaults; treat the dict as read-only."""
+    return _base_payload(get_model_name())
+
+
+@lru_cache(maxsize=4)
+def _base_payload(model: str) -> Dict[str, Any]:
+    return {
+        "model": model,
+        "response_format": "url",
+        "size": "2K",  # balance of speed and quality
+        "watermark": True,
+        "stream": False,
+        "negative_prompt": DEFAULT_NEGATIVE_PROMPT,
+    }
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def decode_json(content: bytes) -> Any:
+    """Parse a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def get_result_cache_ttl() -> float:
+    """Return how long generated images are reused for identical requests, 0 disables it."""
+    return float(dotenv.get_dotenv_value("SEEDREAM4_CACHE_TTL", 3600) or 0)
+
+
+def result_cache_key(payload: Dict[str, Any]) -> str:
+    """Hash a request payload, independent of key order."""
+    canonical = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def get_cached_result(key: str) -> tuple[Any, list[dict[str, Any]]] | None:
+    """Return (raw response, saved images) of a recent identical request whose files still exist."""
+    ttl = get_result_cache_ttl()
+    if ttl <= 0:
+        return None
+    cache = _load_result_cache()
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if time.time() - entry[0] >= ttl or not all(
+        files.exists(img["path"]) for img in entry[2]
+    ):
+        del cache[key]
+        _save_result_cache(cache)
+        return None
+    cache.move_to_end(key)
+    return entry[1], [dict(img) for img in entry[2]]
+
+
+def store_result(key: str, raw: Any, images: list[dict[str, Any]]):
+    """Remember the saved images of a request, evicting expired and least recent entries."""
+    ttl = get_result_cache_ttl()
+    if ttl <= 0:
+        return
+    cache = _load_result_cache()
+    now = time.time()
+    for expired in [k for k, entry in cache.items() if now - entry[0] >= ttl]:
+        del cache[expired]
+    cache[key] = (now, raw, [dict(img) for img in images])
+    cache.move_to_end(key)
+    while len(cache) > RESULT_CACHE_MAX:
+        cache.popitem(last=False)
+    _save_result_cache(cache)
+
+
+def _load_result_cache() -> OrderedDict[str, tuple[float, Any, list[dict[str, Any]]]]:
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = OrderedDict()
+        try:
+            entries = json.loads(files.read_file(RESULT_CACHE_FILE))
+            for key, stored_at, raw, images in entries:
+                _result_cache[key] = (stored_at, raw, images)
+        except Exception:
+            pass  # missing or unreadable index, start empty
+    return _result_cache
+
+
+def _save_result_cache(cache: OrderedDict[str, tuple[float, Any, list[dict[str, Any]]]]):
+    try:
+        files.write_file(
+            RESULT_CACHE_FILE,
+            json.dumps([[key, *entry] for key, entry in cache.items()]),
+        )
+    except Exception:
+        pass  # the in-memory cache still works
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client for the running event loop.
+
+    Reused across calls so API requests and image downloads keep their connections alive.
+    """
+    loop = asyncio.get_running_loop()
+    for closed in [l for l in _http_clients if l.is_closed()]:
+        del _http_clients[closed]
+    client = _http_clients.get(loop)
+    if client is None:
+        client = _http_clients[loop] = httpx.AsyncClient(
+            # retries re-attempt failed connects only, a sent request is never repeated
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                retries=3,
+            ),
+            timeout=120,
+        )
+    return client
+
+
 def get_photorealism_defaults() -> Dict[str, Any]:
     """Return default settings for photorealistic image generation."""
     return {
         "size": "4K",
-        "negative_prompt": "plastic skin, blurry details, cartoonish proportions, low resolution, unrealistic shadows, oversaturated colors",
+        "negative_prompt": DEFAULT_NEGATIVE_PROMPT,
         "style_cues": "photorealistic, cinematic lighting, 8K, HDR, depth of field",
     }
@@ -5,7 +5,7 @@ import time
 import sys
 from typing import Optional, Tuple
 from python.helpers import tty_session, runtime
-from python.helpers.shell_ssh import clean_string
+from python.helpers.strings import clean_string
 
 class LocalInteractiveSession:
     def __init__(self, cwd: str|None = None):
@@ -29,6 +29,11 @@ class LocalInteractiveSession:
         self.full_output = ""
         await self.session.sendline(command)
  
+    async def wait_for_output(self, timeout: float) -> bool:
+        if not self.session:
+            raise Exception("Shell not connected")
+        return await self.session.wait_readable(timeout)
+
     async def read_output(self, timeout: float = 0, reset_full_output: bool = False) -> Tuple[str, Optional[str]]:
         if not self.session:
             raise Exception("Shell not connected")
@@ -1,12 +1,88 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import paramiko
+import threading
 import time
-import re
 from typing import Tuple
 from python.helpers.log import Log
 from python.helpers.print_style import PrintStyle
+from python.helpers.strings import clean_string
 # from python.helpers.strings import calculate_valid_match_lengths
 
+# One authenticated SSH transport per target, shared by every interactive
+# shell opened on it; each shell is its own channel. Values are (client, refs).
+_clients: dict[tuple[str, int, str, str], tuple[paramiko.SSHClient, int]] = {}
+_clients_lock = threading.Lock()
+# held while connecting to one target, so a slow host only delays its own sessions
+_connect_locks: dict[tuple[str, int, str, str], threading.Lock] = {}
+
+# Blocking paramiko calls (handshake, channel setup) run here instead of on
+# the event loop; shared so threads are reused across sessions.
+_SHELL_IO = ThreadPoolExecutor(max_workers=8, thread_name_prefix="shell-io")
+
+
+def _pooled_client(key: tuple[str, int, str, str]) -> paramiko.SSHClient | None:
+    # take a reference on the live pooled client, caller holds _clients_lock
+    client, refs = _clients.get(key, (None, 0))
+    transport = client.get_transport() if client else None
+    if not client or not transport or not transport.is_active():
+        return None
+    _clients[key] = (client, refs + 1)
+    return client
+
+
+def _acquire_client(
+    hostname: str, port: int, username: str, password: str, keepalive_interval: int
+) -> paramiko.SSHClient:
+    key = (hostname, port, username, password)
+    with _clients_lock:
+        client = _pooled_client(key)
+        if client:
+            return client
+        connect_lock = _connect_locks.setdefault(key, threading.Lock())
+
+    with connect_lock:
+        # another session may have connected while this one waited
+        with _clients_lock:
+            client = _pooled_client(key)
+            if client:
+                return client
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            hostname,
+            port,
+            username,
+            password,
+            allow_agent=False,
+            look_for_keys=False,
+        )
+        # sends an SSH_MSG_IGNORE every <keepalive_interval> seconds
+        transport = client.get_transport()
+        if transport and keepalive_interval > 0:
+            transport.set_keepalive(keepalive_interval)
+
+        with _clients_lock:
+            # sessions on a dead predecessor close it themselves
+            _clients[key] = (client, 1)
+        return client
+
+
+def _release_client(
+    hostname: str, port: int, username: str, password: str, client: paramiko.SSHClient
+):
+    key = (hostname, port, username, password)
+    with _clients_lock:
+        pooled, refs = _clients.get(key, (None, 0))
+        if pooled is not client:
+            client.close()
+        elif refs <= 1:
+            del _clients[key]
+            client.close()
+        else:
+            _clients[key] = (client, refs - 1)
+
 
 class SSHInteractiveSession:
 
@@ -21,8 +97,7 @@ class SSHInteractiveSession:
         self.port = port
         self.username = username
         self.password = password
-        self.client = paramiko.SSHClient()
-        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self.client: paramiko.SSHClient | None = None
         self.shell = None
         self.full_output = b""
         self.last_command = b""
@@ -39,28 +114,26 @@ class SSHInteractiveSession:
             Interval in **seconds** between keep-alive packets sent by Paramiko.
             A value ≤ 0 disables Paramiko’s keep-alive feature.
         """
+        loop = asyncio.get_running_loop()
         errors = 0
         while True:
             try:
-                # --- establish TCP/SSH session ---------------------------------
-                self.client.connect(
+                # --- reuse or establish the TCP/SSH session --------------------
+                self.client = await loop.run_in_executor(
+                    _SHELL_IO,
+                    _acquire_client,
                     self.hostname,
                     self.port,
                     self.username,
                     self.password,
-                    allow_agent=False,
-                    look_for_keys=False,
+                    keepalive_interval,
                 )
 
-                # --------- NEW: enable transport-level keep-alives -------------
-                transport = self.client.get_transport()
-                if transport and keepalive_interval > 0:
-                    # sends an SSH_MSG_IGNORE every <keepalive_interval> seconds
-                    transport.set_keepalive(keepalive_interval)
-                # ----------------------------------------------------------------
-
-                # invoke interactive shell
-                self.shell = self.client.invoke_shell(width=100, height=50)
+                # invoke interactive shell on a new channel
+                client = self.client
+                self.shell = await loop.run_in_executor(
+                    _SHELL_IO, lambda: client.invoke_shell(width=100, height=50)
+                )
 
                 # disable systemd/OSC prompt metadata and disable local echo
                 initial_command = "unset PROMPT_COMMAND PS0; stty -echo"
@@ -73,9 +146,10 @@ class SSHInteractiveSession:
                     full, part = await self.read_output()
                     if full and not part:
                         return
-                    time.sleep(0.1)
+                    await asyncio.sleep(0.1)
 
             except Exception as e:
+                self._release()
                 errors += 1
                 if errors < 3:
                     PrintStyle.standard(f"SSH Connection attempt {errors}...")
@@ -84,15 +158,21 @@ class SSHInteractiveSession:
                         content=f"SSH Connection attempt {errors}...",
                         temp=True,
                     )
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                 else:
                     raise e
 
     async def close(self):
         if self.shell:
             self.shell.close()
+        self._release()
+
+    def _release(self):
         if self.client:
-            self.client.close()
+            _release_client(
+                self.hostname, self.port, self.username, self.password, self.client
+            )
+            self.client = None
 
     async def send_command(self, command: str):
         if not self.shell:
@@ -212,35 +292,3 @@ class SSHInteractiveSession:
                         break
 
         return data
-
-def clean_string(input_string):
-    # Remove ANSI escape codes
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    cleaned = ansi_escape.sub("", input_string)
-
-    # remove null bytes
-    cleaned = cleaned.replace("\x00", "")
-
-    # remove ipython \r\r\n> sequences from the start
-    cleaned = re.sub(r'^[ \r]*(?:\r*\n>[ \r]*)*', '', cleaned)
-    # also remove any amount of '> ' sequences from the start
-    cleaned = re.sub(r'^(>\s*)+', '', cleaned)
-
-    # Replace '\r\n' with '\n'
-    cleaned = cleaned.replace("\r\n", "\n")
-
-    # remove leading \r and spaces
-    cleaned = cleaned.lstrip("\r ")
-
-    # Split the string by newline characters to process each segment separately
-    lines = cleaned.split("\n")
-
-    for i in range(len(lines)):
-        # Handle carriage returns '\r' by splitting and taking the last part
-        parts = [part for part in lines[i].split("\r") if part.strip()]
-        if parts:
-            lines[i] = parts[
-                -1
-            ].rstrip()  # Overwrite with the last part after the last '\r'
-
-    return "\n".join(lines)
@@ -6,6 +6,9 @@ def sanitize_string(s: str, encoding: str = "utf-8") -> str:
     # Replace surrogates and invalid unicode with replacement character
     if not isinstance(s, str):
         s = str(s)
+    # pure ASCII cannot contain surrogates, skip the encode/decode round-trip (isascii is O(1))
+    if s.isascii():
+        return s
     return s.encode(encoding, 'replace').decode(encoding, 'replace')
 
 def calculate_valid_match_lengths(first: bytes | str, second: bytes | str, 
@@ -185,4 +188,36 @@ def replace_file_includes(text: str, placeholder_pattern: str = r"§§include\((
             # if file not readable keep original placeholder
             return match.group(0)
 
-    return re.sub(placeholder_pattern, _repl, text)
\ No newline at end of file
+    return re.sub(placeholder_pattern, _repl, text)
+
+def clean_string(input_string):
+    # Remove ANSI escape codes
+    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+    cleaned = ansi_escape.sub("", input_string)
+
+    # remove null bytes
+    cleaned = cleaned.replace("\x00", "")
+
+    # remove ipython \r\r\n> sequences from the start
+    cleaned = re.sub(r'^[ \r]*(?:\r*\n>[ \r]*)*', '', cleaned)
+    # also remove any amount of '> ' sequences from the start
+    cleaned = re.sub(r'^(>\s*)+', '', cleaned)
+
+    # Replace '\r\n' with '\n'
+    cleaned = cleaned.replace("\r\n", "\n")
+
+    # remove leading \r and spaces
+    cleaned = cleaned.lstrip("\r ")
+
+    # Split the string by newline characters to process each segment separately
+    lines = cleaned.split("\n")
+
+    for i in range(len(lines)):
+        # Handle carriage returns '\r' by splitting and taking the last part
+        parts = [part for part in lines[i].split("\r") if part.strip()]
+        if parts:
+            lines[i] = parts[
+                -1
+            ].rstrip()  # Overwrite with the last part after the last '\r'
+
+    return "\n".join(lines)
@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from agent import Agent, LoopData
@@ -7,7 +8,14 @@ from python.helpers.print_style import PrintStyle
 from python.helpers.strings import sanitize_string
 
 
-@dataclass
+@lru_cache(maxsize=512)
+def _nice_key(key: str) -> str:
+    words = key.split('_')
+    words = [words[0].capitalize()] + [word.lower() for word in words[1:]]
+    return ' '.join(words)
+
+
+@dataclass(slots=True)
 class Response:
     message:str
     break_loop: bool
@@ -60,7 +68,4 @@ class Tool:
         return self.agent.context.log.log(type="tool", heading=heading, content="", kvps=self.args)
 
     def nice_key(self, key:str):
-        words = key.split('_')
-        words = [words[0].capitalize()] + [word.lower() for word in words[1:]]
-        result = ' '.join(words)
-        return result
+        return _nice_key(key)
@@ -23,6 +23,7 @@ class TTYSession:
         self.echo = echo  # ← store preference
         self._proc = None
         self._buf = asyncio.Queue()
+        self._ready = asyncio.Event()  # set while _buf holds unread output
 
     def __del__(self):
         # Simple cleanup on object destruction
@@ -57,7 +58,8 @@ class TTYSession:
                 pass
         # Terminate the process if it exists
         if self._proc:
-            self._proc.terminate()
+            # interactive shells ignore SIGTERM, so kill outright
+            self.kill()
             await self._proc.wait()
         self._proc = None
         self._pump_task = None
@@ -102,9 +104,22 @@ class TTYSession:
     async def read(self, timeout=None):
         # Return any decoded text the child produced, or None on timeout
         try:
-            return await asyncio.wait_for(self._buf.get(), timeout)
+            chunk = await asyncio.wait_for(self._buf.get(), timeout)
         except asyncio.TimeoutError:
             return None
+        if self._buf.empty():
+            self._ready.clear()
+        return chunk
+
+    async def wait_readable(self, timeout=None):
+        # Wait until output is available without consuming it; False on timeout
+        if not self._buf.empty():
+            return True
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     # backward-compat alias:
     readline = read
@@ -143,13 +158,14 @@ class TTYSession:
             if not chunk:
                 break
             self._buf.put_nowait(chunk.decode(self.encoding, "replace"))
+            self._ready.set()
 
 
 # ──────────────────────────── POSIX IMPLEMENTATION ────────────────────
 
 
 async def _spawn_posix_pty(cmd, cwd, env, echo):
-    import pty, asyncio, os, termios
+    import pty, asyncio, os, termios, shlex
 
     master, slave = pty.openpty()
 
@@ -159,8 +175,10 @@ async def _spawn_posix_pty(cmd, cwd, env, echo):
         attrs[3] &= ~termios.ECHO  # lflag
         termios.tcsetattr(slave, termios.TCSANOW, attrs)
 
-    proc = await asyncio.create_subprocess_shell(
-        cmd,
+    # exec the shell directly on the pty (no intermediate /bin/sh -c), so
+    # signals from kill()/terminate() reach it instead of orphaning it
+    proc = await asyncio.create_subprocess_exec(
+        *shlex.split(cmd),
         stdin=slave,
         stdout=slave,
         stderr=slave,
@@ -1,7 +1,8 @@
-from flaredantic import FlareConfig, ServeoConfig, ServeoTunnel
-from python.helpers.cloudflare_tunnel import CloudflareTunnel
 import threading
 
+# How long start_tunnel waits for the tunnel URL
+TUNNEL_START_TIMEOUT = 15.0
+
 
 # Singleton to manage the tunnel instance
 class TunnelManager:
@@ -10,6 +11,9 @@ class TunnelManager:
 
     @classmethod
     def get_instance(cls):
+        # Fast path once initialized, lock only for first creation
+        if cls._instance is not None:
+            return cls._instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = cls()
@@ -20,6 +24,7 @@ class TunnelManager:
         self.tunnel_url = None
         self.is_running = False
         self.provider = None
+        self._ready = threading.Event()
 
     def start_tunnel(self, port=80, provider="serveo"):
         """Start a new tunnel or return the existing one's URL"""
@@ -32,43 +37,42 @@ class TunnelManager:
             # Start tunnel in a separate thread to avoid blocking
             def run_tunnel():
                 try:
+                    # Provider backends are imported lazily, only when a tunnel is started
                     if self.provider == "cloudflared":
                         # Use internal CloudflareTunnel helper instead of flaredantic's cloudflared support
+                        from python.helpers.cloudflare_tunnel import CloudflareTunnel
+
                         self.tunnel = CloudflareTunnel(port)
                     else:  # Default to serveo
+                        from flaredantic import ServeoConfig, ServeoTunnel
+
                         config = ServeoConfig(port=port) # type: ignore
                         self.tunnel = ServeoTunnel(config)
 
                     self.tunnel.start()
-                    self.tunnel_url = self.tunnel.tunnel_url
-                    self.is_running = True
+
+                    # For providers like CloudflareTunnel, the URL is populated
+                    # asynchronously on the tunnel instance itself; wait for it
+                    # and mirror it into TunnelManager when available.
+                    url_ready = getattr(self.tunnel, "url_ready", None)
+                    if url_ready is None:
+                        self.tunnel_url = self.tunnel.tunnel_url
+                        self.is_running = True
+                    elif url_ready.wait(timeout=TUNNEL_START_TIMEOUT) and self.tunnel.tunnel_url:
+                        self.tunnel_url = self.tunnel.tunnel_url
+                        self.is_running = True
                 except Exception as e:
                     print(f"Error in tunnel thread: {str(e)}")
+                finally:
+                    self._ready.set()
 
+            self._ready.clear()
             tunnel_thread = threading.Thread(target=run_tunnel)
             tunnel_thread.daemon = True
             tunnel_thread.start()
 
-            # Wait for tunnel to start (max 15 seconds instead of 5)
-            for _ in range(150):  # Increased from 50 to 150 iterations
-                # If TunnelManager already has a URL, we're done
-                if self.tunnel_url:
-                    break
-
-                # For providers like CloudflareTunnel, the URL is populated
-                # asynchronously on the tunnel instance itself; pick it up
-                # and mirror it into TunnelManager when available.
-                if self.tunnel is not None:
-                    tunnel_url = getattr(self.tunnel, "tunnel_url", None)
-                    if tunnel_url:
-                        self.tunnel_url = tunnel_url
-                        self.is_running = True
-                        break
-
-                import time
-
-                time.sleep(0.1)
-
+            # Wait for tunnel to start (max 15 seconds)
+            self._ready.wait(timeout=TUNNEL_START_TIMEOUT)
             return self.tunnel_url
         except Exception as e:
             print(f"Error starting tunnel: {str(e)}")
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, List, Sequence
 import uuid
 from langchain_community.vectorstores import FAISS
@@ -86,6 +87,26 @@ class VectorDB:
             filter=comparator,
         )
 
+    async def search_batch_by_similarity_threshold(
+        self, queries: Sequence[str], limit: int, threshold: float, filter: str = ""
+    ) -> list[list[Document]]:
+        comparator = get_comparator(filter) if filter else None
+
+        # one embedding call for all queries, then the same scoring as asearch
+        vectors = await self.embeddings.aembed_documents(list(queries))
+        results = await asyncio.gather(
+            *[
+                self.db.asimilarity_search_with_score_by_vector(
+                    vector, k=limit, filter=comparator
+                )
+                for vector in vectors
+            ]
+        )
+        return [
+            [doc for doc, score in docs if cosine_normalizer(score) >= threshold]
+            for docs in results
+        ]
+
     async def search_by_metadata(self, filter: str, limit: int = 0) -> list[Document]:
         comparator = get_comparator(filter)
         all_docs = self.db.get_all_docs()
@@ -1,17 +1,21 @@
 import asyncio
 from dataclasses import dataclass
+from functools import lru_cache
 import shlex
-import time
+from typing import TYPE_CHECKING
+import uuid
 from python.helpers.tool import Tool, Response
 from python.helpers import files, rfc_exchange, projects, runtime
 from python.helpers.print_style import PrintStyle
 from python.helpers.shell_local import LocalInteractiveSession
-from python.helpers.shell_ssh import SSHInteractiveSession
-from python.helpers.docker import DockerContainerManager
 from python.helpers.strings import truncate_text as truncate_text_string
 from python.helpers.messages import truncate_text as truncate_text_agent
 import re
 
+if TYPE_CHECKING:
+    # paramiko and its crypto stack only load once an SSH shell is needed
+    from python.helpers.shell_ssh import SSHInteractiveSession
+
 # Timeouts for python, nodejs, and terminal runtimes.
 CODE_EXEC_TIMEOUTS: dict[str, int] = {
     "first_output_timeout": 30,
@@ -28,11 +32,83 @@ OUTPUT_TIMEOUTS: dict[str, int] = {
     "dialog_timeout": 5,
 }
 
+# Errors that mean the shell connection itself is gone (closed pty or
+# socket, dropped SSH channel) and a fresh session is worth a retry.
+_CONNECTION_ERRORS = (OSError, EOFError)
+
+# Minimum seconds between streamed log refreshes of a running command.
+LOG_UPDATE_INTERVAL = 0.1
+
+# Only this much of the output end is inspected for prompts and dialogs.
+OUTPUT_TAIL_SIZE = 4096
+
+# single byte \xXX escapes left in terminal output
+_ESCAPE_RE = re.compile(r"(?<!\\)\\x[0-9A-Fa-f]{2}")
+
+def _union_pattern(patterns: list[re.Pattern]) -> re.Pattern:
+    # fold a pattern list into one alternation, keeping per-pattern ignorecase
+    return re.compile(
+        "|".join(
+            f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+            for p in patterns
+        )
+    )
+
+# compound-statement openers that a "; printf" suffix would turn into a syntax error
+_OPEN_KEYWORDS = frozenset({"then", "do", "else", "elif", "in"})
+
+def _with_end_marker(command: str) -> tuple[str, str | None]:
+    # append a printf of a unique marker so completion is detected exactly;
+    # skipped wherever the suffix could change what the command does
+    cmd = command.rstrip()
+    last_line = cmd.rsplit("\n", 1)[-1]
+    words = last_line.split()
+    if (
+        not words
+        or "<<" in cmd  # heredoc terminator must stay alone on its line
+        or "#" in last_line  # suffix could end up in a comment
+        or words[-1] in _OPEN_KEYWORDS
+        or cmd.endswith(("\\", "|", "&&", "{", "("))
+    ):
+        return command, None
+    token = uuid.uuid4().hex
+    sep = " " if cmd.endswith((";", "&")) else "; "
+    # split format, so an echoed command line never contains the marker itself;
+    # the exit status is saved and restored, so $? after the command stays its own
+    return (
+        f"{cmd}{sep}__az_rc=$?; printf '\\n__AZ_END_%s__\\n' {token}; (exit $__az_rc)",
+        f"__AZ_END_{token}__",
+    )
+
+# any end marker line, including ones left over from an outer command of a
+# nested shell, with the newlines printf put around it
+_END_MARKER_RE = re.compile(r"\n?__AZ_END_[0-9a-f]{32}__\n?")
+
+def _strip_end_markers(text: str) -> str:
+    if "__AZ_END_" not in text:
+        return text
+    return _END_MARKER_RE.sub("", text)
+
 @dataclass
 class ShellWrap:
     id: int
-    session: LocalInteractiveSession | SSHInteractiveSession
+    session: "LocalInteractiveSession | SSHInteractiveSession"
     running: bool
+    connecting: asyncio.Task | None = None  # pending session.connect()
+    end_marker: str | None = None  # printed once the running command finished
+    _last_tail_hash: int | None = None  # output tail seen by the last running check
+    _last_has_dialog: bool = False
+    prompt_re: re.Pattern | None = None  # the one prompt style this shell showed
+    location_label: str = " (local)"  # shown in the output banner
+
+    async def close(self):
+        # let a pending connect settle so close sees a consistent session
+        if self.connecting:
+            try:
+                await self.connecting
+            except Exception:
+                pass
+        await self.session.close()
 
 @dataclass
 class State:
@@ -56,6 +132,12 @@ class CodeExecution(Tool):
         re.compile(r":\s*$"),  # line ending with colon
         re.compile(r"\?\s*$"),  # line ending with question mark
     ]
+    # single-call equivalents of the lists above, used on the polling hot path
+    _prompt_re = _union_pattern(prompt_patterns)
+    _dialog_re = _union_pattern(dialog_patterns)
+
+    # (raw, cleaned) text of the complete lines seen by fix_full_output
+    _fixed_lines: tuple[str, str] = ("", "")
 
     async def execute(self, **kwargs) -> Response:
 
@@ -130,26 +212,32 @@ class CodeExecution(Tool):
 
     async def prepare_state(self, reset=False, session: int | None = None):
         self.state: State | None = self.agent.get_data("_cet_state")
+        ssh_enabled = self.agent.config.code_exec_ssh_enabled
         # always reset state when ssh_enabled changes
-        if not self.state or self.state.ssh_enabled != self.agent.config.code_exec_ssh_enabled:
-            # initialize shells dictionary if not exists
-            shells: dict[int, ShellWrap] = {}
-        else:
-            shells = self.state.shells.copy()
+        if not self.state or self.state.ssh_enabled != ssh_enabled:
+            self.state = State(shells={}, ssh_enabled=ssh_enabled)
+            self.agent.set_data("_cet_state", self.state)
+        shells = self.state.shells
+
+        # nothing to reset or create, the common case
+        if not reset and (session is None or session in shells):
+            return self.state
 
         # Only reset the specified session if provided
         if reset and session is not None and session in shells:
-            await shells[session].session.close()
+            await shells[session].close()
             del shells[session]
         elif reset and not session:
             # Close all sessions if full reset requested
             for s in list(shells.keys()):
-                await shells[s].session.close()
-            shells = {}
+                await shells[s].close()
+            shells.clear()
 
         # initialize local or remote interactive shell interface for session 0 if needed
         if session is not None and session not in shells:
             if self.agent.config.code_exec_ssh_enabled:
+                from python.helpers.shell_ssh import SSHInteractiveSession
+
                 pswd = (
                     self.agent.config.code_exec_ssh_pass
                     if self.agent.config.code_exec_ssh_pass
@@ -166,16 +254,37 @@ class CodeExecution(Tool):
             else:
                 shell = LocalInteractiveSession(cwd=self.get_cwd())
 
-            shells[session] = ShellWrap(id=session, session=shell, running=False)
-            await shell.connect()
+            # connect in the background, callers await it via ensure_connected
+            shells[session] = ShellWrap(
+                id=session,
+                session=shell,
+                running=False,
+                connecting=asyncio.create_task(shell.connect()),
+                location_label=(
+                    " (remote)" if self.agent.config.code_exec_ssh_enabled else " (local)"
+                ),
+            )
 
-        self.state = State(shells=shells, ssh_enabled=self.agent.config.code_exec_ssh_enabled)
-        self.agent.set_data("_cet_state", self.state)
         return self.state
 
+    async def ensure_connected(self, session: int):
+        wrap = self.state.shells[session]
+        if wrap.connecting:
+            try:
+                await wrap.connecting
+            except Exception:
+                # drop the failed shell so the next call starts a fresh one
+                if self.state.shells.get(session) is wrap:
+                    del self.state.shells[session]
+                raise
+            wrap.connecting = None
+        return wrap.session
+
     async def execute_python_code(self, session: int, code: str, reset: bool = False):
         escaped_code = shlex.quote(code)
-        command = f"ipython -c {escaped_code}"
+        # no sqlite history per call (and no lock contention between sessions);
+        # colors would only be stripped again by clean_string
+        command = f"ipython --HistoryManager.enabled=False --colors=NoColor -c {escaped_code}"
         prefix = "python> " + self.format_command_for_output(code) + "\n\n"
         return await self.terminal_session(session, command, reset, prefix)
 
@@ -203,48 +312,51 @@ class CodeExecution(Tool):
         if not self.allow_running:
             if response := await self.handle_running_session(session):
                 return response
-        
+
+        await self.ensure_connected(session)
+
+        # mark the end of fresh bash commands; keystrokes for a program that
+        # is still running go through untouched
+        end_marker = None
+        if not self.state.shells[session].running and (
+            not runtime.is_windows() or self.agent.config.code_exec_ssh_enabled
+        ):
+            command, end_marker = _with_end_marker(command)
+
         # try again on lost connection
         for i in range(2):
             try:
+                wrap = self.state.shells[session]
+                if end_marker:
+                    wrap.end_marker = end_marker
+                wrap.running = True
+                await wrap.session.send_command(command)
+                break
+            except _CONNECTION_ERRORS as e:
+                # only a broken shell is worth a reconnect, anything else
+                # propagates without paying for the reset
+                if i == 1:
+                    raise
+                PrintStyle.error(str(e))
+                await self.prepare_state(reset=True, session=session)
+                await self.ensure_connected(session)
 
-                self.state.shells[session].running = True
-                await self.state.shells[session].session.send_command(command)
-
-                locl = (
-                    " (local)"
-                    if isinstance(self.state.shells[session].session, LocalInteractiveSession)
-                    else (
-                        " (remote)"
-                        if isinstance(self.state.shells[session].session, SSHInteractiveSession)
-                        else " (unknown)"
-                    )
-                )
-
-                PrintStyle(
-                    background_color="white", font_color="#1B4F72", bold=True
-                ).print(f"{self.agent.agent_name} code execution output{locl}")
-                return await self.get_terminal_output(session=session, prefix=prefix, timeouts=(timeouts or CODE_EXEC_TIMEOUTS))
+        locl = self.state.shells[session].location_label
 
-            except Exception as e:
-                if i == 1:
-                    # try again on lost connection
-                    PrintStyle.error(str(e))
-                    await self.prepare_state(reset=True, session=session)
-                    continue
-                else:
-                    raise e
+        PrintStyle(
+            background_color="white", font_color="#1B4F72", bold=True
+        ).print(f"{self.agent.agent_name} code execution output{locl}")
+        return await self.get_terminal_output(session=session, prefix=prefix, timeouts=(timeouts or CODE_EXEC_TIMEOUTS))
 
     def format_command_for_output(self, command: str):
         # truncate long commands
         short_cmd = command[:200]
-        # normalize whitespace for cleaner output
+        # normalize whitespace for cleaner output (split/join beats re.sub here)
         short_cmd = " ".join(short_cmd.split())
         # replace any sequence of ', ", or ` with a single '
         # short_cmd = re.sub(r"['\"`]+", "'", short_cmd) # no need anymore
         # final length
-        short_cmd = truncate_text_string(short_cmd, 100)
-        return f"{short_cmd}"
+        return truncate_text_string(short_cmd, 100)
 
     async def get_terminal_output(
         self,
@@ -261,6 +373,9 @@ class CodeExecution(Tool):
 
         # if not self.state:
         self.state = await self.prepare_state(session=session)
+        await self.ensure_connected(session)
+        end_marker = self.state.shells[session].end_marker
+        marker_seen = False
 
         # Override timeouts if a dict is provided
         if timeouts:
@@ -269,57 +384,122 @@ class CodeExecution(Tool):
             dialog_timeout = timeouts.get("dialog_timeout", dialog_timeout)
             max_exec_timeout = timeouts.get("max_exec_timeout", max_exec_timeout)
 
-        start_time = time.time()
+        # the event loop's monotonic clock, immune to wall clock jumps
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         last_output_time = start_time
         full_output = ""
         truncated_output = ""
+        tail = ""
         got_output = False
+        tail_lines: list[str] = []  # last lines of the output tail
+        tail_kinds: list[str | None] = []  # their _match_tail verdicts
+        log_stale = False  # output arrived that the log item doesn't show yet
+        last_log_time = 0.0
 
         # if prefix, log right away
         if prefix:
             self.log.update(content=prefix)
 
         while True:
-            await asyncio.sleep(sleep_time)
-            full_output, partial_output = await self.state.shells[session].session.read_output(
+            wrap = self.state.shells[session]
+            shell = wrap.session
+            # wake as soon as output arrives when the shell can signal it
+            if isinstance(shell, LocalInteractiveSession):
+                await shell.wait_for_output(sleep_time)
+            else:
+                await asyncio.sleep(sleep_time)
+            full_output, partial_output = await shell.read_output(
                 timeout=1, reset_full_output=reset_full_output
             )
             reset_full_output = False  # only reset once
 
             await self.agent.handle_intervention()
 
-            now = time.time()
+            now = loop.time()
+            prompt_lines: list[str] = []
+            prompt_re = wrap.prompt_re
             if partial_output:
                 PrintStyle(font_color="#85C1E9").stream(partial_output)
                 # full_output += partial_output # Append new output
-                truncated_output = self.fix_full_output(full_output)
-                self.set_progress(truncated_output)
-                heading = self.get_heading_from_output(truncated_output, 0)
-                self.log.update(content=prefix + truncated_output, heading=heading)
+                # keep a bounded tail so per-tick checks don't rescan all output
+                tail = (tail + partial_output)[-OUTPUT_TAIL_SIZE:]
+                clean_tail = _ESCAPE_RE.sub("", tail)
+                after_marker = None
+                if end_marker:
+                    # the shell prints our marker once the command is done,
+                    # and only what follows it can be the prompt we wait for
+                    pos = clean_tail.find(end_marker)
+                    if pos >= 0:
+                        marker_seen = True
+                        done_output = _strip_end_markers(clean_tail[:pos])
+                        after_marker = clean_tail[pos + len(end_marker):]
+                    clean_tail = _strip_end_markers(clean_tail)
+                # one sweep tells prompt and dialog lines apart for this tick
+                # and for the dialog check once output goes quiet
+                tail_lines = clean_tail.splitlines()[-3:]
+                tail_kinds = [
+                    _match_tail(line.strip(), wrap.prompt_re) for line in tail_lines
+                ]
+                if after_marker is not None:
+                    # the command has surely finished, any prompt style counts
+                    prompt_lines = after_marker.splitlines()[-3:]
+                    prompt_re = None
+                elif not end_marker:
+                    prompt_lines = tail_lines
                 last_output_time = now
                 got_output = True
+                log_stale = True
+            elif end_marker and got_output and not marker_seen:
+                # output went quiet before the marker: maybe sitting at a
+                # prompt the marker can't reach, e.g. in a nested shell whose
+                # prompt style differs from the pinned one, so try all styles
+                prompt_lines = tail_lines[-1:]
+                prompt_re = None
+
+            done_heading = None
+            # Check for shell prompt at the end of output
+            for idx, line in enumerate(reversed(prompt_lines)):
+                if _match_tail(line.strip(), prompt_re) == "prompt":
+                    if not wrap.prompt_re or not wrap.prompt_re.search(line.strip()):
+                        # pin the style, or re-pin once the shell switched styles;
+                        # later checks of this shell try it first
+                        wrap.prompt_re = self._find_prompt_pattern(line.strip())
+                    PrintStyle.info(
+                        "Detected shell prompt, returning output early."
+                    )
+                    if marker_seen:
+                        done_heading = self.get_heading_from_output(done_output, 0, True)
+                    else:
+                        done_heading = self.get_heading_from_output(
+                            "\n".join(tail_lines), idx + 1, True
+                        )
+                    break
+            if not done_heading and marker_seen and not partial_output:
+                # marker seen and the shell went quiet without a known prompt
+                PrintStyle.info("Command finished, returning output.")
+                done_heading = self.get_heading_from_output(done_output, 0, True)
+            if done_heading:
+                truncated_output = self.fix_full_output(full_output)
+                self.set_progress(truncated_output)
+                self.log.update(content=prefix + truncated_output, heading=done_heading)
+                self.mark_session_idle(session)
+                return truncated_output
 
-                # Check for shell prompt at the end of output
-                last_lines = (
-                    truncated_output.splitlines()[-3:] if truncated_output else []
-                )
-                last_lines.reverse()
-                for idx, line in enumerate(last_lines):
-                    for pat in self.prompt_patterns:
-                        if pat.search(line.strip()):
-                            PrintStyle.info(
-                                "Detected shell prompt, returning output early."
-                            )
-                            last_lines.reverse()
-                            heading = self.get_heading_from_output(
-                                "\n".join(last_lines), idx + 1, True
-                            )
-                            self.log.update(heading=heading)
-                            self.mark_session_idle(session)
-                            return truncated_output
+            # masking and truncating the log content touches all output, so
+            # refresh it at a bounded rate; every return below logs in full
+            if log_stale and now - last_log_time >= LOG_UPDATE_INTERVAL:
+                truncated_output = self.fix_full_output(full_output)
+                self.set_progress(truncated_output)
+                heading = self.get_heading_from_output(clean_tail, 0)
+                self.log.update(content=prefix + truncated_output, heading=heading)
+                last_log_time = now
+                log_stale = False
 
             # Check for max execution time
             if now - start_time > max_exec_timeout:
+                if log_stale:
+                    truncated_output = self.fix_full_output(full_output)
                 sysinfo = self.agent.read_prompt(
                     "fw.code.max_time.md", timeout=max_exec_timeout
                 )
@@ -344,6 +524,8 @@ class CodeExecution(Tool):
             else:
                 # Waiting for more output after first output
                 if now - last_output_time > between_output_timeout:
+                    if log_stale:
+                        truncated_output = self.fix_full_output(full_output)
                     sysinfo = self.agent.read_prompt(
                         "fw.code.pause_time.md", timeout=between_output_timeout
                     )
@@ -356,34 +538,24 @@ class CodeExecution(Tool):
                     return response
 
                 # potential dialog detection
-                if now - last_output_time > dialog_timeout:
-                    # Check for dialog prompt at the end of output
-                    last_lines = (
-                        truncated_output.splitlines()[-2:] if truncated_output else []
+                # Check for dialog prompt at the end of output
+                if now - last_output_time > dialog_timeout and "dialog" in tail_kinds[-2:]:
+                    PrintStyle.info(
+                        "Detected dialog prompt, returning output early."
                     )
-                    for line in last_lines:
-                        for pat in self.dialog_patterns:
-                            if pat.search(line.strip()):
-                                PrintStyle.info(
-                                    "Detected dialog prompt, returning output early."
-                                )
-
-                                sysinfo = self.agent.read_prompt(
-                                    "fw.code.pause_dialog.md", timeout=dialog_timeout
-                                )
-                                response = self.agent.read_prompt(
-                                    "fw.code.info.md", info=sysinfo
-                                )
-                                if truncated_output:
-                                    response = truncated_output + "\n\n" + response
-                                PrintStyle.warning(sysinfo)
-                                heading = self.get_heading_from_output(
-                                    truncated_output, 0
-                                )
-                                self.log.update(
-                                    content=prefix + response, heading=heading
-                                )
-                                return response
+                    if log_stale:
+                        truncated_output = self.fix_full_output(full_output)
+
+                    sysinfo = self.agent.read_prompt(
+                        "fw.code.pause_dialog.md", timeout=dialog_timeout
+                    )
+                    response = self.agent.read_prompt("fw.code.info.md", info=sysinfo)
+                    if truncated_output:
+                        response = truncated_output + "\n\n" + response
+                    PrintStyle.warning(sysinfo)
+                    heading = self.get_heading_from_output(truncated_output, 0)
+                    self.log.update(content=prefix + response, heading=heading)
+                    return response
 
     async def handle_running_session(
         self,
@@ -399,31 +571,34 @@ class CodeExecution(Tool):
         full_output, _ = await self.state.shells[session].session.read_output(
             timeout=1, reset_full_output=reset_full_output
         )
+        end_marker = self.state.shells[session].end_marker
+        if end_marker and end_marker in full_output[-OUTPUT_TAIL_SIZE:]:
+            # the previous command has finished since it was last checked
+            self.mark_session_idle(session)
+            return None
         truncated_output = self.fix_full_output(full_output)
         self.set_progress(truncated_output)
         heading = self.get_heading_from_output(truncated_output, 0)
 
-        last_lines = (
-            truncated_output.splitlines()[-3:] if truncated_output else []
-        )
-        last_lines.reverse()
-        for idx, line in enumerate(last_lines):
-            for pat in self.prompt_patterns:
-                if pat.search(line.strip()):
-                    PrintStyle.info(
-                        "Detected shell prompt, returning output early."
-                    )
-                    self.mark_session_idle(session)
-                    return None
-
-        has_dialog = False 
-        for line in last_lines:
-            for pat in self.dialog_patterns:
-                if pat.search(line.strip()):
-                    has_dialog = True
-                    break
-            if has_dialog:
-                break
+        # nothing new arrived since the last check, so the verdict stands
+        wrap = self.state.shells[session]
+        tail_hash = hash(full_output[-1024:])
+        if tail_hash == wrap._last_tail_hash:
+            has_dialog = wrap._last_has_dialog
+        else:
+            tail = _ESCAPE_RE.sub("", full_output[-OUTPUT_TAIL_SIZE:])
+            # a quiet check, so all prompt styles, the shell may have nested since the pin
+            kinds = [_match_tail(line.strip()) for line in tail.splitlines()[-3:]]
+            if "prompt" in kinds:
+                PrintStyle.info(
+                    "Detected shell prompt, returning output early."
+                )
+                self.mark_session_idle(session)
+                return None
+
+            has_dialog = "dialog" in kinds
+            wrap._last_tail_hash = tail_hash
+            wrap._last_has_dialog = has_dialog
 
         if has_dialog:
             sys_info = self.agent.read_prompt("fw.code.pause_dialog.md", timeout=1)       
@@ -437,10 +612,15 @@ class CodeExecution(Tool):
         self.log.update(content=prefix + response, heading=heading)
         return response
     
+    def _find_prompt_pattern(self, line: str) -> re.Pattern | None:
+        return next((p for p in self.prompt_patterns if p.search(line)), None)
+
     def mark_session_idle(self, session: int = 0):
         # Mark session as idle - command finished
         if self.state and session in self.state.shells:
             self.state.shells[session].running = False
+            self.state.shells[session].end_marker = None
+            self.state.shells[session]._last_tail_hash = None
 
     async def reset_terminal(self, session=0, reason: str | None = None):
         # Print the reason for the reset to the console if provided
@@ -479,8 +659,18 @@ class CodeExecution(Tool):
         return self.get_heading() + done_icon
 
     def fix_full_output(self, output: str):
-        # remove any single byte \xXX escapes
-        output = re.sub(r"(?<!\\)\\x[0-9A-Fa-f]{2}", "", output)
+        # remove any single byte \xXX escapes; they never span lines, so
+        # completed lines cleaned on an earlier tick are reused as they are
+        done_src, done_clean = self._fixed_lines
+        if not output.startswith(done_src):
+            done_src, done_clean = "", ""
+        cut = output.rfind("\n") + 1
+        if cut > len(done_src):
+            done_clean += _ESCAPE_RE.sub("", output[len(done_src):cut])
+            done_src = output[:cut]
+        self._fixed_lines = (done_src, done_clean)
+        output = done_clean + _ESCAPE_RE.sub("", output[len(done_src):])
+        output = _strip_end_markers(output)
         # Strip every line of output before truncation
         # output = "\n".join(line.strip() for line in output.splitlines())
         output = truncate_text_agent(agent=self.agent, output=output, threshold=1000000) # ~1MB, larger outputs should be dumped to file, not read from terminal
@@ -493,6 +683,25 @@ class CodeExecution(Tool):
         project_path = projects.get_project_folder(project_name)
         normalized = files.normalize_a0_path(project_path)
         return normalized
-        
 
-        
\ No newline at end of file
+
+@lru_cache(maxsize=8)
+def _tail_re(prompt_re: re.Pattern) -> re.Pattern:
+    # prompt and dialog checks folded into one regex, told apart by group name
+    return re.compile(
+        f"(?P<prompt>{prompt_re.pattern})|(?P<dialog>{CodeExecution._dialog_re.pattern})"
+    )
+
+
+# polls keep re-testing the same trailing lines, so memoize the verdicts
+@lru_cache(maxsize=1024)
+def _match_tail(line: str, prompt_re: re.Pattern | None = None) -> str | None:
+    # "prompt", "dialog" or None; a prompt wins when a line matches both.
+    # prompt_re limits prompts to one pinned style instead of all of them
+    prompt_re = prompt_re or CodeExecution._prompt_re
+    m = _tail_re(prompt_re).search(line)
+    if m is None:
+        return None
+    if m.lastgroup == "dialog" and prompt_re.search(line, m.start() + 1):
+        return "prompt"
+    return m.lastgroup
@@ -7,24 +7,22 @@ from python.helpers.document_query import DocumentQueryHelper
 class DocumentQueryTool(Tool):
 
     async def execute(self, **kwargs):
-        document_uri = kwargs.get("document")
-        document_uris = []
-
+        document_uri = kwargs.get("document") or kwargs.get("documents")
         if isinstance(document_uri, list):
             document_uris = document_uri
-        elif isinstance(document_uri, str):
-            document_uris = [document_uri]
+        else:
+            document_uris = [document_uri] if isinstance(document_uri, str) and document_uri else []
 
         if not document_uris:
             return Response(message="Error: no document provided", break_loop=False)
 
-        queries = (
-            kwargs["queries"]
-            if "queries" in kwargs
-            else [kwargs["query"]]
-            if ("query" in kwargs and kwargs["query"])
-            else []
-        )
+        queries = kwargs.get("queries")
+        if queries is None:
+            query = kwargs.get("query")
+            queries = [query] if query else []
+        elif not isinstance(queries, list):
+            queries = [queries] if queries else []
+
         try:
 
             progress = []
@@ -36,12 +34,23 @@ class DocumentQueryTool(Tool):
             
             helper = DocumentQueryHelper(self.agent, progress_callback)
             if not queries:
-                contents = await asyncio.gather(
-                    *[helper.document_get_content(uri) for uri in document_uris]
-                )
+                # report each document as it arrives, keep the requested order in the result
+                contents = [""] * len(document_uris)
+                async for index, uri, text in self._stream_contents(helper, document_uris):
+                    contents[index] = text
+                    progress_callback(f"Fetched {uri}")
                 content = "\n\n---\n\n".join(contents)
             else:
                 _, content = await helper.document_qa(document_uris, queries)
             return Response(message=content, break_loop=False)
         except Exception as e:  # pylint: disable=broad-exception-caught
             return Response(message=f"Error processing document: {e}", break_loop=False)
+
+    async def _stream_contents(self, helper: DocumentQueryHelper, document_uris: list[str]):
+        async def fetch(index: int, uri: str):
+            return index, uri, await helper.document_get_content(uri)
+
+        for done in asyncio.as_completed(
+            [fetch(index, uri) for index, uri in enumerate(document_uris)]
+        ):
+            yield await done
@@ -1,3 +1,4 @@
+import asyncio
 from agent import Agent, UserMessage
 from python.helpers.tool import Tool, Response
 from python.tools.code_execution_tool import CodeExecution
@@ -15,9 +16,25 @@ class Input(Tool):
 
         # forward keyboard input to code execution tool
         args = {"runtime": "terminal", "code": keyboard, "session": session, "allow_running": True}
-        cet = CodeExecution(self.agent, "code_execution_tool", "", args, self.message, self.loop_data)
-        cet.log = self.log
-        return await cet.execute(**args)
+        cet, lock = self.get_session_tool(session, args)
+        async with lock:
+            cet.args = args
+            cet.message = self.message
+            cet.loop_data = self.loop_data
+            cet.log = self.log
+            cet.progress = ""
+            return await cet.execute(**args)
+
+    def get_session_tool(self, session: int, args: dict) -> tuple[CodeExecution, asyncio.Lock]:
+        # one code execution tool per terminal session, reused across keyboard inputs
+        tools: dict[int, tuple[CodeExecution, asyncio.Lock]] | None = self.agent.get_data("_input_cet")
+        if tools is None:
+            tools = {}
+            self.agent.set_data("_input_cet", tools)
+        if session not in tools:
+            cet = CodeExecution(self.agent, "code_execution_tool", "", args, self.message, self.loop_data)
+            tools[session] = (cet, asyncio.Lock())
+        return tools[session]
 
     def get_log_object(self):
         return self.agent.context.log.log(type="code_exe", heading=f"icon://keyboard {self.agent.agent_name}: Using tool '{self.name}'", content="", kvps=self.args)
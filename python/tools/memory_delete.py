@@ -1,12 +1,15 @@
+import re
 from python.helpers.memory import Memory
 from python.helpers.tool import Tool, Response
 
+_ID_SPLIT = re.compile(r"[,\s]+")
+
 
 class MemoryDelete(Tool):
 
     async def execute(self, ids="", **kwargs):
         db = await Memory.get(self.agent)
-        ids = [id.strip() for id in ids.split(",") if id.strip()]
+        ids = [id for id in _ID_SPLIT.split(ids) if id]
         dels = await db.delete_documents_by_ids(ids=ids)
 
         result = self.agent.read_prompt("fw.memories_deleted.md", memory_count=len(dels))
@@ -1,4 +1,5 @@
 from python.helpers.memory import Memory
+from python.helpers.memory_query_cache import query_cache
 from python.helpers.tool import Tool, Response
 
 DEFAULT_THRESHOLD = 0.7
@@ -9,12 +10,22 @@ class MemoryLoad(Tool):
 
     async def execute(self, query="", threshold=DEFAULT_THRESHOLD, limit=DEFAULT_LIMIT, filter="", **kwargs):
         db = await Memory.get(self.agent)
-        docs = await db.search_similarity_threshold(query=query, limit=limit, threshold=threshold, filter=filter)
+        # agents often repeat a recall, serve it without embedding the query again
+        docs = query_cache.get(db.memory_subdir, query, threshold, limit, filter)
+        if docs is None:
+            generation = query_cache.generation(db.memory_subdir)
+            # a rephrased recall with a near-identical embedding reuses earlier results
+            embedding = await db.embed_query(query)
+            docs = query_cache.get_similar(db.memory_subdir, embedding, threshold, limit, filter)
+            if docs is None:
+                docs = await db.search_similarity_threshold(
+                    query=query, limit=limit, threshold=threshold, filter=filter, embedding=embedding
+                )
+            query_cache.put(db.memory_subdir, query, threshold, limit, filter, docs, generation, embedding)
 
         if len(docs) == 0:
             result = self.agent.read_prompt("fw.memories_not_found.md", query=query)
         else:
-            text = "\n\n".join(Memory.format_docs_plain(docs))
-            result = str(text)
+            result = "\n\n".join(Memory.format_docs_plain(docs))
 
         return Response(message=result, break_loop=False)
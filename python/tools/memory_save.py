@@ -1,4 +1,5 @@
 from python.helpers.memory import Memory
+from python.helpers.memory_insert_queue import MemoryInsertQueue
 from python.helpers.tool import Tool, Response
 
 
@@ -9,10 +10,15 @@ class MemorySave(Tool):
         if not area:
             area = Memory.Area.MAIN.value
 
+        # batched saves share one embedding call and index save with concurrent ones
+        batch = kwargs.pop("batch", False)
         metadata = {"area": area, **kwargs}
 
         db = await Memory.get(self.agent)
-        id = await db.insert_text(text, metadata)
+        if batch:
+            id = await MemoryInsertQueue.get(db).insert_text(text, metadata)
+        else:
+            id = await db.insert_text(text, metadata)
 
         result = self.agent.read_prompt("fw.memory_saved.md", memory_id=id)
         return Response(message=result, break_loop=False)
@@ -2,6 +2,18 @@ from python.helpers.tool import Tool, Response
 from agent import AgentContext
 from python.helpers.notification import NotificationPriority, NotificationType
 
+# accepted values and members, so validation is a lookup instead of a failing constructor
+_TYPES = {**{t.value: t for t in NotificationType}, **{t: t for t in NotificationType}}
+_PRIORITIES = {**{p.value: p for p in NotificationPriority}, **{p: p for p in NotificationPriority}}
+
+
+def _lookup(table: dict, value):
+    try:
+        return table.get(value)
+    except TypeError:  # unhashable value from the tool arguments
+        return None
+
+
 class NotifyUserTool(Tool):
 
     async def execute(self, **kwargs):
@@ -13,14 +25,12 @@ class NotifyUserTool(Tool):
         priority = self.args.get("priority", NotificationPriority.HIGH) # by default, agents should notify with high priority
         timeout = int(self.args.get("timeout", 30)) # agent's notifications should have longer timeouts
 
-        try:
-            notification_type = NotificationType(notification_type)
-        except ValueError:
+        valid_type = _lookup(_TYPES, notification_type)
+        if valid_type is None:
             return Response(message=f"Invalid notification type: {notification_type}", break_loop=False)
 
-        try:
-            priority = NotificationPriority(priority)
-        except ValueError:
+        valid_priority = _lookup(_PRIORITIES, priority)
+        if valid_priority is None:
             return Response(message=f"Invalid notification priority: {priority}", break_loop=False)
 
         if not message:
@@ -30,8 +40,8 @@ class NotifyUserTool(Tool):
             message=message,
             title=title,
             detail=detail,
-            type=notification_type,
-            priority=priority,
+            type=valid_type,
+            priority=valid_priority,
             display_time=timeout,
         )
         return Response(message=self.agent.read_prompt("fw.notify_user.notification_sent.md"), break_loop=False)
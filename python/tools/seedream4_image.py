@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import time
 import os
 from typing import Any
 
-import requests
+import httpx
 
 # Seedream4 helpers centralise API config (endpoint, model, env flags).
 from python.helpers import dotenv, files, seedream4
@@ -16,6 +16,16 @@ from python.helpers.notification import (
     NotificationPriority,
 )
 
+# prompts mentioning any of these already choose their look, the rest get PHOTO_STYLE_CUES
+PHOTO_STYLE_TOKENS = ("photorealistic", "cinematic")
+PHOTO_STYLE_CUES = seedream4.get_photorealism_defaults()["style_cues"]
+
+MAX_PARALLEL_DOWNLOADS = 4
+WRITE_BUFFER_SIZE = 1024 * 1024
+MAX_IMAGE_BYTES = 64 * 1024 * 1024  # far above a 4K PNG, guards against runaway responses
+DOWNLOAD_ATTEMPTS = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 
 class Seedream4ImageTool(Tool):
     """Tool for calling BytePlus Seedream 4.x image generation/edit API.
@@ -68,21 +78,21 @@ class Seedream4ImageTool(Tool):
         endpoint = seedream4.SEEDREAM4_ENDPOINT
 
         # Auto-enrich prompt for photorealism if not specified
-        if "photorealistic" not in prompt.lower() and "cinematic" not in prompt.lower():
-            prompt += ", photorealistic, cinematic lighting, 8K, HDR, depth of field"
+        prompt_lower = prompt.lower()
+        if not any(token in prompt_lower for token in PHOTO_STYLE_TOKENS):
+            prompt = f"{prompt}, {PHOTO_STYLE_CUES}"
 
-        payload: dict[str, Any] = {
-            "model": seedream4.SEEDREAM4_MODEL,
-            "prompt": prompt,
-            "response_format": "url",
-            "size": size or "2K",  # Default to 2K for balance of speed and quality
-            "watermark": True if watermark is None else bool(watermark),
-            "stream": False if stream is None else bool(stream),
-            "negative_prompt": kwargs.get(
-                "negative_prompt",
-                "plastic skin, blurry details, cartoonish proportions, low resolution, unrealistic shadows, oversaturated colors",
-            ),
-        }
+        # copy of the shared template, only arguments the caller passed override its defaults
+        payload: dict[str, Any] = seedream4.get_base_payload().copy()
+        payload["prompt"] = prompt
+        if size:
+            payload["size"] = size
+        if watermark is not None:
+            payload["watermark"] = bool(watermark)
+        if stream is not None:
+            payload["stream"] = bool(stream)
+        if "negative_prompt" in kwargs:
+            payload["negative_prompt"] = kwargs["negative_prompt"]
 
         if mode in ("edit", "expand"):
             if not image_url and image_path:
@@ -124,71 +134,18 @@ class Seedream4ImageTool(Tool):
                 "max_images": int(max_images or 5),
             }
 
-        try:
-            resp = requests.post(
-                endpoint,
-                headers=seedream4.build_headers(api_key),
-                data=json.dumps(payload),
-                timeout=120,
-            )
-        except Exception as e:
-            return Response(message=f"Seedream4 HTTP error: {e}", break_loop=False)
-
-        if resp.status_code >= 400:
-            return Response(
-                message=f"Seedream4 API error {resp.status_code}: {resp.text}",
-                break_loop=False,
-            )
-
-        try:
-            data = resp.json()
-        except Exception:
-            return Response(
-                message=f"Seedream4 returned non-JSON response: {resp.text[:500]}",
-                break_loop=False,
-            )
-
-        urls: list[str] = []
-        if isinstance(data, dict):
-            if isinstance(data.get("data"), list):
-                for item in data["data"]:
-                    url = item.get("url") if isinstance(item, dict) else None
-                    if isinstance(url, str):
-                        urls.append(url)
-            url = data.get("url")
-            if isinstance(url, str):
-                urls.append(url)
-
-        urls = list(dict.fromkeys(urls))
-
-        stored: list[dict[str, Any]] = []
-        # Save under ./export_zone relative to the base dir so files are
-        # visible in the repo as export_zone/seedream4_*.png.
-        rel_dir = "export_zone"
-        abs_dir = files.get_abs_path(rel_dir)
-        os.makedirs(abs_dir, exist_ok=True)
-        ts = int(time.time())
-        for idx, url in enumerate(urls):
-            path: str | None = None
-            filename = f"seedream4_{ts}_{idx}.png"
-            abs_path = os.path.join(abs_dir, filename)
-            try:
-                img_resp = requests.get(url, timeout=120)
-                if img_resp.status_code < 400:
-                    with open(abs_path, "wb") as f:
-                        f.write(img_resp.content)
-                    rel_path = f"{rel_dir}/{filename}"
-                    path = rel_path
-            except Exception:
-                path = None
-            # Prefer exposing the locally saved path to the rest of the system.
-            # The remote Seedream URL is time-limited and should be used only
-            # internally (it's still available under result["raw"]).
-            if path:
-                web_path = f"img://{path}"
-                stored.append({"path": path, "web_path": web_path})
-            else:
-                stored.append({"remote_url": url})
+        # an identical recent request is answered from the images it already saved
+        cache_key = seedream4.result_cache_key(payload)
+        cached = seedream4.get_cached_result(cache_key)
+        if cached:
+            data, stored = cached
+        else:
+            generated = await self._generate(endpoint, api_key, payload)
+            if isinstance(generated, Response):
+                return generated
+            data, stored = generated
+            if stored and all(img.get("path") for img in stored):
+                seedream4.store_result(cache_key, data, stored)
 
         result = {
             "mode": mode,
@@ -231,3 +188,109 @@ class Seedream4ImageTool(Tool):
         return Response(
             message=summary, break_loop=False, additional={"seedream4_result": result}
         )
+
+    async def _generate(
+        self, endpoint: str, api_key: str, payload: dict[str, Any]
+    ) -> tuple[Any, list[dict[str, Any]]] | Response:
+        """Call the API and save the returned images, or return an error Response."""
+        client = seedream4.get_http_client()
+        try:
+            resp = await client.post(
+                endpoint,
+                headers=seedream4.build_headers(api_key),
+                content=seedream4.encode_payload(payload),
+            )
+        except Exception as e:
+            return Response(message=f"Seedream4 HTTP error: {e}", break_loop=False)
+
+        if resp.status_code >= 400:
+            return Response(
+                message=f"Seedream4 API error {resp.status_code}: {resp.text}",
+                break_loop=False,
+            )
+
+        try:
+            data = seedream4.decode_json(resp.content)
+        except Exception:
+            return Response(
+                message=f"Seedream4 returned non-JSON response: {resp.text[:500]}",
+                break_loop=False,
+            )
+
+        # image urls in response order, de-duplicated in the same pass
+        urls: list[str] = []
+        seen: set[str] = set()
+        if isinstance(data, dict):
+            items = data.get("data")
+            candidates = [
+                item.get("url") if isinstance(item, dict) else None
+                for item in (items if isinstance(items, list) else ())
+            ]
+            candidates.append(data.get("url"))
+            for url in candidates:
+                if isinstance(url, str) and url not in seen:
+                    seen.add(url)
+                    urls.append(url)
+
+        # Save under ./export_zone relative to the base dir so files are
+        # visible in the repo as export_zone/seedream4_*.png.
+        rel_dir = "export_zone"
+        abs_dir = files.get_abs_path(rel_dir)
+        os.makedirs(abs_dir, exist_ok=True)
+        ts = time.time_ns() // 1_000_000  # ms, cached results must not share file names
+        filenames = [f"seedream4_{ts}_{idx}.png" for idx in range(len(urls))]
+        limit = asyncio.Semaphore(MAX_PARALLEL_DOWNLOADS)
+        saved = await asyncio.gather(
+            *[
+                self._download(client, url, os.path.join(abs_dir, filename), limit)
+                for url, filename in zip(urls, filenames)
+            ]
+        )
+
+        stored: list[dict[str, Any]] = []
+        for url, filename, ok in zip(urls, filenames, saved):
+            path = f"{rel_dir}/{filename}" if ok else None
+            # Prefer exposing the locally saved path to the rest of the system.
+            # The remote Seedream URL is time-limited and should be used only
+            # internally (it's still available under result["raw"]).
+            if path:
+                web_path = f"img://{path}"
+                stored.append({"path": path, "web_path": web_path})
+            else:
+                stored.append({"remote_url": url})
+
+        return data, stored
+
+    async def _download(
+        self, client: httpx.AsyncClient, url: str, abs_path: str, limit: asyncio.Semaphore
+    ) -> bool:
+        """Stream one generated image to abs_path, returning whether it was saved."""
+        async with limit:
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(2 ** (attempt - 1))  # back off 1s, 2s, ...
+                try:
+                    async with client.stream("GET", url) as img_resp:
+                        if img_resp.status_code in RETRY_STATUSES:
+                            continue
+                        if img_resp.status_code >= 400:
+                            return False
+                        if int(img_resp.headers.get("content-length") or 0) > MAX_IMAGE_BYTES:
+                            return False
+                        size = 0
+                        with open(abs_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                            # chunks go to disk as they arrive, memory stays flat whatever the image size;
+                            # no chunk_size, re-chunking would copy every byte once more
+                            async for chunk in img_resp.aiter_bytes():
+                                size += len(chunk)
+                                if size > MAX_IMAGE_BYTES:
+                                    break
+                                f.write(chunk)
+                    if size > MAX_IMAGE_BYTES:
+                        os.remove(abs_path)  # oversized, not worth another attempt
+                        return False
+                    return True
+                except Exception:
+                    if os.path.exists(abs_path):
+                        os.remove(abs_path)  # drop a partial file
+            return False
@@ -6,7 +6,14 @@ from python.extensions.system_prompt._10_system_prompt import (
 
 class Unknown(Tool):
     async def execute(self, **kwargs):
-        tools = get_tools_prompt(self.agent)
+        # rendered once per agent, repeated misses reuse it; keyed on vision, which adds a section
+        vision = self.agent.config.chat_model.vision
+        cached: tuple[bool, str] | None = self.agent.get_data("_unknown_tools_prompt")
+        if cached and cached[0] == vision:
+            tools = cached[1]
+        else:
+            tools = get_tools_prompt(self.agent)
+            self.agent.set_data("_unknown_tools_prompt", (vision, tools))
         return Response(
             message=self.agent.read_prompt(
                 "fw.tool_not_found.md", tool_name=self.name, tools_prompt=tools
@@ -1,5 +1,9 @@
-import base64
+import asyncio
+import bisect
+import math
 import os
+import shutil
+import subprocess
 from python.helpers.print_style import PrintStyle
 from python.helpers.tool import Tool, Response
 from python.helpers import files, images
@@ -9,7 +13,12 @@ from python.helpers import history
 MAX_FRAMES = 6  # Reduced to stay within model limits
 MAX_PIXELS = 768_000
 QUALITY = 75
+LOW_MOTION_QUALITY = 60  # near duplicates of the previous sampled frame add little detail
+LOW_MOTION_DIFF = 8  # mean absolute gray level difference below which a frame counts as one
 TOKENS_PER_FRAME = 1500
+SEEK_MIN_GAP = 120  # frames, closer targets are grabbed sequentially instead of seeking
+KEYFRAME_SNAP = 0.05  # share of the video a uniform target may move to land on a keyframe
+KEYFRAME_PROBE_TIMEOUT = 10  # seconds
 
 VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".webm", ".m4v", ".wmv", ".flv"}
 
@@ -36,6 +45,7 @@ class VideoLoad(Tool):
         self.errors: list[str] = []
         self.video_info: list[dict] = []
 
+        valid: list[tuple[str, str]] = []
         for path in paths:
             # Convert /a0/ paths to local paths in development mode
             local_path = files.fix_dev_path(path)
@@ -49,17 +59,35 @@ class VideoLoad(Tool):
                 self.errors.append(f"File not found: {path}")
                 continue
 
-            try:
-                frames, info = await self._extract_frames(path, local_path, max_frames, strategy)
+            valid.append((path, local_path))
+
+        # decoding and encoding run in OpenCV without the GIL, so videos are processed in parallel
+        limit = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def extract(path: str, local_path: str):
+            async with limit:
+                return await asyncio.to_thread(
+                    self._extract_frames, path, local_path, max_frames, strategy
+                )
+
+        results = await asyncio.gather(
+            *[extract(path, local_path) for path, local_path in valid],
+            return_exceptions=True,
+        )
+        for (path, _), result in zip(valid, results):
+            if isinstance(result, Exception):
+                self.errors.append(f"Error processing {path}: {result}")
+                PrintStyle().error(f"Error processing video {path}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                frames, info = result
                 self.frames_data.extend(frames)
                 self.video_info.append(info)
-            except Exception as e:
-                self.errors.append(f"Error processing {path}: {e}")
-                PrintStyle().error(f"Error processing video {path}: {e}")
 
         return Response(message="dummy", break_loop=False)
 
-    async def _extract_frames(
+    def _extract_frames(
         self, path: str, local_path: str, max_frames: int, strategy: str
     ) -> tuple[list[dict], dict]:
         """Extract frames from a video file.
@@ -71,8 +99,6 @@ class VideoLoad(Tool):
             strategy: Frame selection strategy
         """
         import cv2
-        from PIL import Image
-        import io
 
         # Open video directly from local path (no temp file needed)
         cap = cv2.VideoCapture(local_path)
@@ -96,24 +122,58 @@ class VideoLoad(Tool):
 
             # Determine which frames to extract
             frame_indices = self._get_frame_indices(total_frames, max_frames, strategy)
+            if strategy == "uniform" and total_frames > max_frames:
+                keyframes = self._get_keyframe_indices(
+                    local_path, fps, frame_indices, total_frames
+                )
+                if keyframes:
+                    frame_indices = self._snap_to_keyframes(
+                        frame_indices, keyframes, total_frames
+                    )
 
             frames = []
+            prev_gray = None
+            pos: int | None = 0  # index of the frame the next grab() returns, None when unknown
             for idx in frame_indices:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-                ret, frame = cap.read()
+                if pos is None or pos > idx or idx - pos > SEEK_MIN_GAP:
+                    # far ahead, a keyframe seek beats decoding every frame in between
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                    pos = idx
+                # nearby frames are reached by grabbing forward, without seeking and re-decoding
+                while pos < idx and cap.grab():
+                    pos += 1
+                if pos < idx or not cap.grab():
+                    pos = None
+                    continue
+                pos += 1
+                ret, frame = cap.retrieve()
                 if not ret:
                     continue
 
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-                # Convert to PIL Image and compress
-                pil_img = Image.fromarray(frame_rgb)
-                img_bytes = io.BytesIO()
-                pil_img.save(img_bytes, format="JPEG", quality=95)
-                compressed = images.compress_image(
-                    img_bytes.getvalue(), max_pixels=MAX_PIXELS, quality=QUALITY
+                # Downscale and encode straight from the BGR frame, one JPEG encode per frame
+                frame_height, frame_width = frame.shape[:2]
+                pixels = frame_width * frame_height
+                if pixels > MAX_PIXELS:
+                    scale = math.sqrt(MAX_PIXELS / pixels)
+                    frame = cv2.resize(
+                        frame,
+                        (int(frame_width * scale), int(frame_height * scale)),
+                        interpolation=cv2.INTER_AREA,
+                    )
+                # static scenes (talking heads, screencasts) are encoded at a lower quality
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                quality = QUALITY
+                if prev_gray is not None and prev_gray.shape == gray.shape:
+                    if float(cv2.absdiff(gray, prev_gray).mean()) < LOW_MOTION_DIFF:
+                        quality = LOW_MOTION_QUALITY
+                prev_gray = gray
+                ok, encoded = cv2.imencode(
+                    ".jpg",
+                    frame,
+                    [int(cv2.IMWRITE_JPEG_QUALITY), quality, int(cv2.IMWRITE_JPEG_OPTIMIZE), 1],
                 )
+                if not ok:
+                    continue
 
                 timestamp = idx / fps if fps > 0 else 0
                 frames.append(
@@ -121,7 +181,7 @@ class VideoLoad(Tool):
                         "path": path,
                         "frame_index": idx,
                         "timestamp": round(timestamp, 2),
-                        "image_b64": base64.b64encode(compressed).decode("utf-8"),
+                        "image_b64": images.b64_str(encoded),  # no tobytes() copy
                     }
                 )
 
@@ -149,21 +209,81 @@ class VideoLoad(Tool):
         step = (total_frames - 1) / (max_frames - 1)
         return [int(i * step) for i in range(max_frames)]
 
+    def _get_keyframe_indices(
+        self, local_path: str, fps: float, frame_indices: list[int], total_frames: int
+    ) -> list[int]:
+        """Sorted keyframe indices near the targets, empty when ffprobe is unavailable."""
+        ffprobe = shutil.which("ffprobe")
+        if not ffprobe or fps <= 0 or not frame_indices:
+            return []
+        # only the windows a target may snap within are read, not the whole container
+        window = total_frames * KEYFRAME_SNAP / fps
+        intervals = ",".join(
+            f"{max(idx / fps - window, 0):.3f}%{idx / fps + window:.3f}"
+            for idx in frame_indices
+        )
+        try:
+            # packet flags come from the container, nothing is decoded
+            result = subprocess.run(
+                [
+                    ffprobe, "-v", "error", "-select_streams", "v:0",
+                    "-read_intervals", intervals,
+                    "-show_entries", "stream=start_time:packet=pts_time,flags",
+                    "-of", "csv", local_path,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=KEYFRAME_PROBE_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return []
+        if result.returncode != 0:
+            return []
+        start_time = 0.0
+        keyframe_times = []
+        for line in result.stdout.splitlines():
+            section, *fields = line.split(",")
+            try:
+                if section == "stream" and fields:
+                    start_time = float(fields[0])
+                elif section == "packet" and len(fields) >= 2 and "K" in fields[1]:
+                    keyframe_times.append(float(fields[0]))
+            except ValueError:
+                continue  # N/A
+        # frame indices count from the first frame, not from pts zero
+        return sorted({round((t - start_time) * fps) for t in keyframe_times})
+
+    def _snap_to_keyframes(
+        self, frame_indices: list[int], keyframes: list[int], total_frames: int
+    ) -> list[int]:
+        """Move each target onto its nearest keyframe when that is close, seeking there decodes one frame."""
+        max_shift = total_frames * KEYFRAME_SNAP
+        used = set(frame_indices)  # two targets never share a frame
+        snapped = []
+        for idx in frame_indices:
+            pos = bisect.bisect_left(keyframes, idx)
+            nearest = min(
+                keyframes[max(pos - 1, 0) : pos + 1], key=lambda k: abs(k - idx)
+            )
+            if nearest == idx or (
+                abs(nearest - idx) < max_shift and nearest < total_frames and nearest not in used
+            ):
+                used.add(nearest)
+                idx = nearest
+            snapped.append(idx)
+        return sorted(snapped)
+
     async def after_execution(self, response: Response, **kwargs):
         """Add extracted frames to agent's context."""
-        content = []
-
         if self.frames_data:
             # Add frames with timestamps (simplified format like vision_load)
-            for frame in self.frames_data:
-                content.append(
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/jpeg;base64,{frame['image_b64']}"
-                        },
-                    }
-                )
+            content = [
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:image/jpeg;base64,{frame['image_b64']}"},
+                }
+                for frame in self.frames_data
+            ]
 
             msg = history.RawMessage(
                 raw_content=content,
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 from python.helpers.print_style import PrintStyle
 from python.helpers.tool import Tool, Response
@@ -11,46 +12,77 @@ QUALITY = 75
 TOKENS_ESTIMATE = 1500
 
 
+async def _read_file_bin(path: str) -> bytes:
+    if runtime.is_development():
+        # rfc results travel as json, so binary content comes base64 encoded
+        return base64.b64decode(
+            await runtime.call_development_function(files.read_file_base64, path)
+        )
+    return await asyncio.to_thread(files.read_file_bin, path)
+
+
+def _is_compact_jpeg(image_data: bytes) -> bool:
+    # gray or color jpeg within the pixel limit and at most ~4 bits per pixel,
+    # about what QUALITY produces; cmyk/ycck ones still get converted to rgb
+    if image_data[:2] != b"\xff\xd8":
+        return False
+    dims = images.peek_dims(image_data)
+    if not dims or dims[2] not in (1, 3):
+        return False
+    pixels = dims[0] * dims[1]
+    return 0 < pixels <= MAX_PIXELS and len(image_data) * 2 <= pixels
+
+
 class VisionLoad(Tool):
     async def execute(self, paths: list[str] = [], **kwargs) -> Response:
 
         self.images_dict = {}
         template: list[dict[str, str]] = []  # type: ignore
 
-        for path in paths:
-            if not await runtime.call_development_function(files.exists, str(path)):
-                continue
-
-            if path not in self.images_dict:
-                mime_type, _ = guess_type(str(path))
-                if mime_type and mime_type.startswith("image/"):
-                    try:
-                        # Read binary file
-                        file_content = await runtime.call_development_function(
-                            files.read_file_base64, str(path)
-                        )
-                        file_content = base64.b64decode(file_content)
-                        # Compress and convert to JPEG
-                        compressed = images.compress_image(
-                            file_content, max_pixels=MAX_PIXELS, quality=QUALITY
-                        )
-                        # Encode as base64
-                        file_content_b64 = base64.b64encode(compressed).decode("utf-8")
-
-                        # DEBUG: Save compressed image
-                        # await runtime.call_development_function(
-                        #     files.write_file_base64, str(path), file_content_b64
-                        # )
-
-                        # Construct the data URL (always JPEG after compression)
-                        self.images_dict[path] = file_content_b64
-                    except Exception as e:
-                        self.images_dict[path] = None
-                        PrintStyle().error(f"Error processing image {path}: {e}")
-                        self.agent.context.log.log("warning", f"Error processing image {path}: {e}")
+        # images are read and compressed concurrently, results keep the order of paths
+        unique_paths = list(dict.fromkeys(paths))
+        results = await asyncio.gather(*[self._process(path) for path in unique_paths])
+        for path, (processed, image) in zip(unique_paths, results):
+            if processed:
+                self.images_dict[path] = image
 
         return Response(message="dummy", break_loop=False)
 
+    async def _process(self, path: str) -> tuple[bool, str | None]:
+        """Return whether path is an existing image, and its compressed base64 JPEG or None on error."""
+        if not await runtime.call_development_function(files.exists, str(path)):
+            return False, None
+
+        mime_type, _ = guess_type(str(path))
+        if not mime_type or not mime_type.startswith("image/"):
+            return False, None
+
+        try:
+            # Read binary file
+            file_content = await _read_file_bin(str(path))
+            if _is_compact_jpeg(file_content):
+                # already a small jpeg, re-encoding would only cost time
+                compressed = file_content
+            else:
+                # Compress and convert to JPEG, Pillow releases the GIL while encoding
+                compressed = await asyncio.to_thread(
+                    images.compress_image, file_content, max_pixels=MAX_PIXELS, quality=QUALITY
+                )
+            # Encode as base64
+            file_content_b64 = images.b64_str(compressed)
+
+            # DEBUG: Save compressed image
+            # await runtime.call_development_function(
+            #     files.write_file_base64, str(path), file_content_b64
+            # )
+
+            # Construct the data URL (always JPEG after compression)
+            return True, file_content_b64
+        except Exception as e:
+            PrintStyle().error(f"Error processing image {path}: {e}")
+            self.agent.context.log.log("warning", f"Error processing image {path}: {e}")
+            return True, None
+
     async def after_execution(self, response: Response, **kwargs):
 
         # build image data messages for LLMs, or error message
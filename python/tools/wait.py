@@ -5,6 +5,8 @@ from python.helpers.print_style import PrintStyle
 from python.helpers.wait import managed_wait
 from python.helpers.localization import Localization
 
+SHORT_WAIT_SECONDS = 1.0
+
 class WaitTool(Tool):
 
     async def execute(self, **kwargs) -> Response:
@@ -36,7 +38,7 @@ class WaitTool(Tool):
                 days=int(days),
                 hours=int(hours),
                 minutes=int(minutes),
-                seconds=int(seconds),
+                seconds=float(seconds),
             )
             if wait_duration.total_seconds() <= 0:
                 return Response(
@@ -53,13 +55,18 @@ class WaitTool(Tool):
 
         PrintStyle.info(f"Waiting until {target_time.isoformat()}...")
 
-        target_time = await managed_wait(
-            agent=self.agent,
-            target_time=target_time,
-            is_duration_wait=is_duration_wait,
-            log=self.log,
-            get_heading_callback=self.get_heading
-        )
+        remaining = (target_time - now).total_seconds()
+        if is_duration_wait and remaining <= SHORT_WAIT_SECONDS:
+            # within one polling tick of managed_wait, nothing to report or pause in between
+            await asyncio.sleep(remaining)
+        else:
+            target_time = await managed_wait(
+                agent=self.agent,
+                target_time=target_time,
+                is_duration_wait=is_duration_wait,
+                log=self.log,
+                get_heading_callback=self.get_heading
+            )
 
         if self.log:
             self.log.update(heading=self.get_heading("Done", done=True))
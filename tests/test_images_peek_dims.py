@@ -0,0 +1,81 @@
+import os
+import struct
+import sys
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python.helpers.images import peek_dims
+
+
+def _segment(marker: int, payload: bytes) -> bytes:
+    return bytes([0xFF, marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _sof(marker: int, width: int, height: int, components: int) -> bytes:
+    payload = struct.pack(">BHHB", 8, height, width, components)
+    payload += b"".join(bytes([i + 1, 0x11, 0]) for i in range(components))
+    return _segment(marker, payload)
+
+
+def _jpeg(*segments: bytes) -> bytes:
+    return b"\xff\xd8" + b"".join(segments) + b"\xff\xd9"
+
+
+def _png(width: int, height: int, color_type: int) -> bytes:
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    chunk = struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr
+    return b"\x89PNG\r\n\x1a\n" + chunk + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+
+
+APP0 = _segment(0xE0, b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00")
+DHT = _segment(0xC4, bytes(17) + b"\x00")
+
+
+def test_baseline_sof():
+    assert peek_dims(_jpeg(APP0, _sof(0xC0, 640, 480, 3))) == (640, 480, 3)
+
+
+def test_progressive_sof():
+    assert peek_dims(_jpeg(APP0, _sof(0xC2, 1920, 1080, 1))) == (1920, 1080, 1)
+
+
+def test_dht_before_sof_is_skipped():
+    assert peek_dims(_jpeg(DHT, _sof(0xC0, 100, 50, 3))) == (100, 50, 3)
+
+
+def test_fill_bytes_before_marker():
+    data = b"\xff\xd8" + b"\xff\xff\xff" + _sof(0xC0, 32, 16, 3)
+    assert peek_dims(data) == (32, 16, 3)
+
+
+def test_cmyk_component_count():
+    assert peek_dims(_jpeg(APP0, _sof(0xC0, 64, 64, 4))) == (64, 64, 4)
+
+
+def test_truncated_jpeg():
+    data = _jpeg(APP0, _sof(0xC0, 640, 480, 3))
+    sof_at = 2 + len(APP0)
+    for cut in (3, sof_at, sof_at + 7, sof_at + 9):
+        assert peek_dims(data[:cut]) is None
+
+
+def test_not_an_image():
+    assert peek_dims(b"GIF89a" + bytes(20)) is None
+    assert peek_dims(b"\xff\xd8\x00\x00" + bytes(20)) is None
+
+
+def test_png_color_types():
+    expected = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+    for color_type, components in expected.items():
+        assert peek_dims(_png(300, 200, color_type)) == (300, 200, components)
+
+
+def test_compact_jpeg_rejects_four_components():
+    from python.tools.vision_load import _is_compact_jpeg
+
+    padding = _segment(0xFE, bytes(1000))  # comment, keeps ~1 bit per pixel
+    rgb = _jpeg(APP0, _sof(0xC0, 100, 100, 3), padding)
+    cmyk = _jpeg(APP0, _sof(0xC0, 100, 100, 4), padding)
+    assert _is_compact_jpeg(rgb)
+    assert not _is_compact_jpeg(cmyk)
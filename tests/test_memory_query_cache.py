@@ -0,0 +1,163 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python.helpers import memory_query_cache
+from python.helpers.memory_query_cache import QueryCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(memory_query_cache.time, "monotonic", clock)
+    return clock
+
+
+def _put(cache: QueryCache, subdir: str, query: str, results: list, **kwargs):
+    cache.put(subdir, query, 0.7, 10, "", results, cache.generation(subdir), **kwargs)
+
+
+def test_hit_and_miss():
+    cache = QueryCache()
+    _put(cache, "default", "cats", ["a"])
+    assert cache.get("default", "cats", 0.7, 10) == ["a"]
+    assert cache.get("default", " cats ", 0.7, 10) == ["a"]
+    assert cache.get("default", "dogs", 0.7, 10) is None
+    assert cache.get("default", "cats", 0.8, 10) is None
+    assert cache.get("other", "cats", 0.7, 10) is None
+
+
+def test_ttl_expiry(monkeypatch):
+    clock = _clock(monkeypatch)
+    cache = QueryCache(ttl_seconds=60)
+    _put(cache, "default", "cats", ["a"])
+    clock.now += 59
+    assert cache.get("default", "cats", 0.7, 10) == ["a"]
+    clock.now += 1
+    assert cache.get("default", "cats", 0.7, 10) is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_lru_eviction_at_max_size():
+    cache = QueryCache(max_size=2)
+    _put(cache, "default", "one", [1])
+    _put(cache, "default", "two", [2])
+    assert cache.get("default", "one", 0.7, 10) == [1]  # "two" is now the oldest
+    _put(cache, "default", "three", [3])
+    assert cache.get("default", "two", 0.7, 10) is None
+    assert cache.get("default", "one", 0.7, 10) == [1]
+    assert cache.get("default", "three", 0.7, 10) == [3]
+    assert cache.get_stats()["size"] == 2
+
+
+def test_put_after_invalidate_is_dropped():
+    cache = QueryCache()
+    generation = cache.generation("default")
+    cache.invalidate("default")  # a write raced the search
+    cache.put("default", "cats", 0.7, 10, "", ["stale"], generation)
+    assert cache.get("default", "cats", 0.7, 10) is None
+
+    # other subdirs keep their generation
+    other = cache.generation("other")
+    cache.put("other", "cats", 0.7, 10, "", ["fresh"], other)
+    assert cache.get("other", "cats", 0.7, 10) == ["fresh"]
+
+
+def test_invalidate_one_subdir():
+    cache = QueryCache()
+    _put(cache, "a", "cats", ["a"])
+    _put(cache, "b", "cats", ["b"])
+    cache.invalidate("a")
+    assert cache.get("a", "cats", 0.7, 10) is None
+    assert cache.get("b", "cats", 0.7, 10) == ["b"]
+
+
+def test_invalidate_all_subdirs():
+    cache = QueryCache()
+    _put(cache, "a", "cats", ["a"])
+    _put(cache, "b", "cats", ["b"])
+    generation = cache.generation("b")
+    cache.invalidate()
+    assert cache.get("a", "cats", 0.7, 10) is None
+    assert cache.get("b", "cats", 0.7, 10) is None
+    cache.put("b", "dogs", 0.7, 10, "", ["stale"], generation)
+    assert cache.get("b", "dogs", 0.7, 10) is None
+
+
+def test_results_are_copies():
+    cache = QueryCache()
+    results = ["a"]
+    _put(cache, "default", "cats", results)
+    results.append("b")
+    cached = cache.get("default", "cats", 0.7, 10)
+    assert cached == ["a"]
+    cached.append("c")  # type: ignore
+    assert cache.get("default", "cats", 0.7, 10) == ["a"]
+
+
+def _vector(*values: float, dim: int = 4) -> list[float]:
+    return list(values) + [0.0] * (dim - len(values))
+
+
+def test_similar_hit_above_min_similarity():
+    cache = QueryCache(min_similarity=0.97)
+    _put(cache, "default", "cats", ["a"], embedding=_vector(1.0))
+    # cosine ~0.995, only the direction counts
+    assert cache.get_similar("default", _vector(2.0, 0.2), 0.7, 10) == ["a"]
+    assert cache.get_stats()["semantic_hits"] == 1
+
+
+def test_similar_miss_below_min_similarity():
+    cache = QueryCache(min_similarity=0.97)
+    _put(cache, "default", "cats", ["a"], embedding=_vector(1.0))
+    # cosine ~0.894
+    assert cache.get_similar("default", _vector(1.0, 0.5), 0.7, 10) is None
+
+
+def test_similar_keys_isolate_settings():
+    cache = QueryCache()
+    embedding = _vector(1.0)
+    cache.put("default", "cats", 0.7, 10, "area == 'main'", ["a"], 0, embedding)
+    assert cache.get_similar("default", embedding, 0.7, 10, "area == 'main'") == ["a"]
+    assert cache.get_similar("default", embedding, 0.8, 10, "area == 'main'") is None
+    assert cache.get_similar("default", embedding, 0.7, 5, "area == 'main'") is None
+    assert cache.get_similar("default", embedding, 0.7, 10) is None
+    assert cache.get_similar("other", embedding, 0.7, 10, "area == 'main'") is None
+
+
+def test_similar_rows_reuse_least_recently_used():
+    cache = QueryCache(semantic_size=2)
+    _put(cache, "default", "x", ["x"], embedding=_vector(1.0))
+    _put(cache, "default", "y", ["y"], embedding=_vector(0.0, 1.0))
+    assert cache.get_similar("default", _vector(1.0), 0.7, 10) == ["x"]  # "y" is now the oldest
+    _put(cache, "default", "z", ["z"], embedding=_vector(0.0, 0.0, 1.0))
+    assert cache.get_similar("default", _vector(0.0, 1.0), 0.7, 10) is None
+    assert cache.get_similar("default", _vector(1.0), 0.7, 10) == ["x"]
+    assert cache.get_similar("default", _vector(0.0, 0.0, 1.0), 0.7, 10) == ["z"]
+
+
+def test_similar_resets_on_dimension_change():
+    cache = QueryCache()
+    _put(cache, "default", "cats", ["a"], embedding=_vector(1.0, dim=4))
+    # a different embedding model, rows of the old dimension can't be compared
+    assert cache.get_similar("default", _vector(1.0, dim=8), 0.7, 10) is None
+    _put(cache, "default", "dogs", ["b"], embedding=_vector(1.0, dim=8))
+    assert cache.get_similar("default", _vector(1.0, dim=8), 0.7, 10) == ["b"]
+    assert cache.get_similar("default", _vector(1.0, dim=4), 0.7, 10) is None
+
+
+def test_similar_dropped_on_invalidate():
+    cache = QueryCache()
+    _put(cache, "a", "cats", ["a"], embedding=_vector(1.0))
+    _put(cache, "b", "cats", ["b"], embedding=_vector(1.0))
+    cache.invalidate("a")
+    assert cache.get_similar("a", _vector(1.0), 0.7, 10) is None
+    assert cache.get_similar("b", _vector(1.0), 0.7, 10) == ["b"]